@@ -0,0 +1,29 @@
+"""Shared helpers for the benchmark scripts.
+
+Adds the repository root to ``sys.path`` so that ``src`` can be imported
+when a script is run directly, and provides a tiny best-of-N timer.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from typing import Callable
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def best_of(func: Callable[[], object], repeat: int = 3) -> float:
+    """Return the best wall-clock time (seconds) of *repeat* calls to *func*."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if elapsed < best:
+            best = elapsed
+    return best
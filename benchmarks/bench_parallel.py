@@ -0,0 +1,51 @@
+"""Scaling of :func:`src.simulation.run_parallel_simulation` over cores.
+
+Runs the same seeded simulation (mean of ``n=30`` normal draws, scalar
+per-replicate mode, which is the CPU-bound case that benefits most) with
+1, 2, 4, ... worker processes up to ``os.cpu_count()`` and checks that
+every run yields bit-identical values.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from _common import REPO_ROOT  # noqa: F401  (puts the repo on sys.path)
+
+from src.simulation import run_parallel_simulation
+
+
+def normal_factory(rng):
+    return lambda size: rng.normal(0.0, 1.0, size=size)
+
+
+def main(n_simulations: int) -> None:
+    cores = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cores:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cores:
+        workers.append(cores)
+
+    reference = None
+    base = None
+    print(f"n_simulations={n_simulations}, cpu_count={cores}")
+    for w in workers:
+        start = time.perf_counter()
+        result = run_parallel_simulation(
+            normal_factory, np.mean, 30, n_simulations, seed=2024, max_workers=w
+        )
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        if reference is None:
+            reference = result.values
+        same = "identical" if np.array_equal(result.values, reference) else "DIFFERENT"
+        print(f"  workers={w:<3} {elapsed:>8.2f} s  {base / elapsed:>5.2f}x  {same}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
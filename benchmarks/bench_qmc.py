@@ -0,0 +1,82 @@
+"""Error versus replicate count: pseudo-random vs randomized QMC generators.
+
+Estimates ``E[s^2]`` (the sample variance, ddof=1) of ``n=8`` standard
+normal draws, whose exact value is 1, and ``E[mean(X)**2]`` of ``n=8``
+Exponential(1) draws (exact value ``1 + 1/8``) with
+:func:`src.simulation.run_statistic_simulation` in vectorized mode. The
+root-mean-square error over independent replications (independent seeds /
+scramblings) is reported for each ``N``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from _common import REPO_ROOT  # noqa: F401  (puts the repo on sys.path)
+
+from src.qmc_generators import qmc_exponential, qmc_normal
+from src.simulation import run_statistic_simulation
+
+SAMPLE_SIZE = 8
+
+
+def sample_variance(block, axis):
+    return block.var(axis=axis, ddof=1)
+
+
+def squared_mean(block, axis):
+    return block.mean(axis=axis) ** 2
+
+
+CASES: Dict[str, Dict] = {
+    "normal var": {
+        "truth": 1.0,
+        "statistic": sample_variance,
+        "prng": lambda rng: (lambda size: rng.normal(size=size)),
+        "sobol": lambda rng: qmc_normal(SAMPLE_SIZE, seed=rng),
+        "halton": lambda rng: qmc_normal(SAMPLE_SIZE, method="halton", seed=rng),
+    },
+    "exp mean^2": {
+        "truth": 1.0 + 1.0 / SAMPLE_SIZE,
+        "statistic": squared_mean,
+        "prng": lambda rng: (lambda size: rng.exponential(size=size)),
+        "sobol": lambda rng: qmc_exponential(SAMPLE_SIZE, seed=rng),
+        "halton": lambda rng: qmc_exponential(SAMPLE_SIZE, method="halton", seed=rng),
+    },
+}
+
+
+def rmse(factory: Callable, statistic: Callable, truth: float, n: int, reps: int) -> float:
+    errors = []
+    for rep in range(reps):
+        gen = factory(np.random.default_rng(rep))
+        result = run_statistic_simulation(
+            gen, statistic, SAMPLE_SIZE, n, vectorized=True, chunk_size=n
+        )
+        errors.append(result.summary["mean"] - truth)
+    return float(np.sqrt(np.mean(np.square(errors))))
+
+
+def main(exponents: List[int], reps: int = 20) -> None:
+    for label, case in CASES.items():
+        print(f"{label}: RMSE over {reps} replications")
+        print(f"{'N':>8} {'prng':>11} {'sobol':>11} {'halton':>11} {'sobol gain':>11}")
+        for e in exponents:
+            n = 2**e
+            errs = {
+                kind: rmse(case[kind], case["statistic"], case["truth"], n, reps)
+                for kind in ("prng", "sobol", "halton")
+            }
+            gain = errs["prng"] / errs["sobol"]
+            print(
+                f"{n:>8} {errs['prng']:>11.2e} {errs['sobol']:>11.2e} "
+                f"{errs['halton']:>11.2e} {gain:>10.1f}x"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [8, 10, 12, 14, 16])
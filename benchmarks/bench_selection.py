@@ -0,0 +1,56 @@
+"""Benchmark selection-based ``median`` / ``quantile`` against sorting.
+
+The reference implementation is the previous behaviour of
+:func:`src.pure_python_stats.quantile`: copy, ``sorted()``, interpolate.
+Three selection variants are timed: the default copying path, the
+in-place path on a caller-owned list (the copy needed to keep the input
+intact between repeats is excluded from the timing), and ``median``.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from typing import List
+
+from _common import best_of
+
+from src import pure_python_stats as pps
+
+
+def sorted_quantile(data: List[float], q: float) -> float:
+    """Reference: full sort followed by linear interpolation."""
+
+    return pps._interpolate_sorted(sorted(data), q)
+
+
+def inplace_time(data: List[float], q: float, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        buffer = list(data)
+        start = time.perf_counter()
+        pps.quantile(buffer, q, inplace=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes: List[int], q: float = 0.9) -> None:
+    rng = random.Random(2024)
+    header = f"{'n':>10} {'sorted [s]':>11} {'select [s]':>11} {'inplace [s]':>12} {'median [s]':>11} {'speedup':>8}"
+    print(header)
+    for n in sizes:
+        data = [rng.random() for _ in range(n)]
+        repeat = 3 if n <= 1_000_000 else 1
+        t_sort = best_of(lambda: sorted_quantile(data, q), repeat)
+        t_select = best_of(lambda: pps.quantile(data, q), repeat)
+        t_inplace = inplace_time(data, q, repeat)
+        t_median = best_of(lambda: pps.median(data), repeat)
+        print(
+            f"{n:>10} {t_sort:>11.4f} {t_select:>11.4f} {t_inplace:>12.4f} "
+            f"{t_median:>11.4f} {t_sort / t_select:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000, 1_000_000, 10_000_000])
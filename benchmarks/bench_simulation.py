@@ -0,0 +1,74 @@
+"""Benchmark scalar vs vectorized :func:`src.simulation.run_statistic_simulation`.
+
+All variants estimate the sampling distribution of the mean of ``n=30``
+standard normal draws:
+
+- ``loop/random``: pure-Python ``random.gauss`` generator and
+  :func:`src.pure_python_stats.mean` (the README example);
+- ``loop/numpy``: NumPy generator, still one replicate per call;
+- ``vectorized``: ``(rows, n)`` blocks reduced with ``np.mean(axis=1)``;
+- ``loop/fill`` and ``vectorized/fill``: the same with a
+  :class:`src.distributions.NormalGenerator`, which refills one buffer.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+
+import numpy as np
+
+from _common import best_of
+
+from src.distributions import NormalGenerator
+from src.pure_python_stats import mean
+from src.simulation import run_statistic_simulation
+
+
+def main(n_simulations: int, sample_size: int = 30) -> None:
+    py_rng = random.Random(0)
+    np_rng = np.random.default_rng(0)
+
+    def normal(size):
+        return np_rng.normal(0.0, 1.0, size=size)
+
+    timings = {
+        "loop/random": best_of(
+            lambda: run_statistic_simulation(
+                lambda n: [py_rng.gauss(0.0, 1.0) for _ in range(n)],
+                mean,
+                sample_size,
+                n_simulations,
+            ),
+            1,
+        ),
+        "loop/numpy": best_of(
+            lambda: run_statistic_simulation(normal, np.mean, sample_size, n_simulations),
+            1,
+        ),
+        "vectorized": best_of(
+            lambda: run_statistic_simulation(
+                normal, np.mean, sample_size, n_simulations, vectorized=True
+            ),
+        ),
+        "loop/fill": best_of(
+            lambda: run_statistic_simulation(
+                NormalGenerator(seed=0), np.mean, sample_size, n_simulations
+            ),
+            1,
+        ),
+        "vectorized/fill": best_of(
+            lambda: run_statistic_simulation(
+                NormalGenerator(seed=0), np.mean, sample_size, n_simulations, vectorized=True
+            ),
+        ),
+    }
+
+    base = timings["loop/random"]
+    print(f"n_simulations={n_simulations}, sample_size={sample_size}")
+    for label, t in timings.items():
+        print(f"  {label:<16} {t:>9.3f} s  {base / t:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
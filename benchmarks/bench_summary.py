@@ -0,0 +1,48 @@
+"""Benchmark the fused :func:`src.pure_python_stats.summary`.
+
+Compares the single-sort summary against composing the individual
+statistics (``mean``, ``std_dev``, ``quantile``, ``median``, ``iqr``, ...),
+which is how ``summary`` used to be implemented and which sorts the data
+once per order statistic.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from typing import Dict, List
+
+from _common import best_of
+
+from src import pure_python_stats as pps
+
+
+def composed_summary(data: List[float]) -> Dict[str, float]:
+    """Reference: one call per statistic, as before the fused engine."""
+
+    return {
+        "count": float(len(data)),
+        "mean": pps.mean(data),
+        "std": pps.std_dev(data, ddof=1),
+        "min": pps.minimum(data),
+        "q25": pps.quantile(data, 0.25),
+        "median": pps.median(data),
+        "q75": pps.quantile(data, 0.75),
+        "max": pps.maximum(data),
+        "iqr": pps.iqr(data),
+        "range": pps.data_range(data),
+    }
+
+
+def main(sizes: List[int]) -> None:
+    rng = random.Random(12345)
+    print(f"{'n':>10} {'composed [s]':>14} {'fused [s]':>12} {'speedup':>9}")
+    for n in sizes:
+        data = [rng.gauss(0.0, 1.0) for _ in range(n)]
+        t_old = best_of(lambda: composed_summary(data))
+        t_new = best_of(lambda: pps.summary(data))
+        print(f"{n:>10} {t_old:>14.4f} {t_new:>12.4f} {t_old / t_new:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
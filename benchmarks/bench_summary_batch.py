@@ -0,0 +1,33 @@
+"""Benchmark :func:`src.numpy_stats.np_summary_batch` against a Python loop.
+
+The reference calls :func:`src.numpy_stats.np_summary` once per series
+(row) and collects the resulting dicts.
+"""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+from _common import best_of
+
+from src import numpy_stats as nps
+
+
+def looped(matrix: np.ndarray) -> list:
+    return [nps.np_summary(row) for row in matrix]
+
+
+def main(shapes: List[Tuple[int, int]]) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'series x length':>16} {'loop [s]':>10} {'batch [s]':>10} {'speedup':>9}")
+    for rows, cols in shapes:
+        matrix = rng.standard_normal((rows, cols))
+        t_loop = best_of(lambda: looped(matrix))
+        t_batch = best_of(lambda: nps.np_summary_batch(matrix, axis=1))
+        print(f"{rows:>7} x {cols:<6} {t_loop:>10.4f} {t_batch:>10.4f} {t_loop / t_batch:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main([(1_000, 30), (10_000, 30), (10_000, 250), (1_000, 5_000)])
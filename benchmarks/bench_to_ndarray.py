@@ -0,0 +1,44 @@
+"""Benchmark input conversion in :func:`src.numpy_stats._to_ndarray`.
+
+Compares the former ``np.asarray(list(values), dtype=float)`` conversion
+with the zero-copy fast path for ``float64`` ndarrays, ``array('d')`` and
+``memoryview`` inputs, timing :func:`src.numpy_stats.np_mean` end to end.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import List
+
+import numpy as np
+
+from _common import best_of
+
+from src import numpy_stats as nps
+
+
+def list_conversion_mean(values) -> float:
+    """Reference: materialize a list of boxed floats, then a second array."""
+
+    return float(np.asarray(list(values), dtype=float).mean())
+
+
+def main(sizes: List[int]) -> None:
+    print(f"{'n':>10} {'input':>12} {'via list [s]':>13} {'fast path [s]':>14} {'speedup':>9}")
+    rng = np.random.default_rng(0)
+    for n in sizes:
+        base = rng.standard_normal(n)
+        inputs = {
+            "ndarray": base,
+            "array('d')": array("d", base.tobytes()),
+            "memoryview": memoryview(base),
+        }
+        for label, values in inputs.items():
+            t_old = best_of(lambda: list_conversion_mean(values), 1)
+            t_new = best_of(lambda: nps.np_mean(values))
+            print(f"{n:>10} {label:>12} {t_old:>13.4f} {t_new:>14.5f} {t_old / t_new:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000_000, 10_000_000])
@@ -0,0 +1,302 @@
+"""Checkpoint and resume long-running simulations.
+
+:func:`run_checkpointed_simulation` runs the same chunked loop as
+:func:`simulation.run_statistic_simulation`, and periodically writes the
+partial state of the run to a checkpoint file:
+
+- the parameters of the run and the state of its
+  :class:`numpy.random.Generator` (the bit generator state);
+- the number of replicates completed and, with ``streaming=True``, the
+  serialized :class:`quantile_sketch.KLLSketch` they were folded into.
+
+Without streaming the values themselves go to a preallocated ``.npy``
+file next to the checkpoint (``<checkpoint>.values.npy``), written
+through a memory map as the chunks arrive. A checkpoint therefore only
+flushes the new chunks, however many values the run has produced.
+
+If the process is interrupted, :func:`resume_simulation` restores that
+state and continues with the next chunk. Because every random draw comes
+from the restored generator and chunk boundaries are unchanged, the final
+result is identical to that of an uninterrupted run.
+
+Functions cannot be stored without pickling, so the generator factory and
+the statistic are passed again to :func:`resume_simulation`; they must
+describe the same simulation. All randomness of the generator must come
+from the ``rng`` handed to the factory.
+
+Checkpoints are NumPy ``.npz`` archives (loaded with
+``allow_pickle=False``): the sketch is stored as its
+:meth:`~quantile_sketch.KLLSketch.to_bytes` blob and the scalar
+parameters as a small JSON header. Each checkpoint is written to a
+temporary file and atomically renamed, after the values file has been
+flushed, so a crash while writing leaves the previous checkpoint intact
+and every value it counts as completed on disk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterator
+
+import numpy as np
+
+from .quantile_sketch import KLLSketch
+from .simulation import (
+    GeneratorFactory,
+    SimulationResult,
+    _STREAM_CHUNK,
+    _default_chunk_size,
+    _iter_value_chunks,
+)
+
+_FORMAT_VERSION = 2
+
+
+def _write_checkpoint(path: str, header: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> None:
+    """Atomically replace the checkpoint at *path*."""
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        np.savez(fh, header=np.array(json.dumps(header)), **arrays)
+    os.replace(tmp, path)
+
+
+def _load_checkpoint(path: str) -> tuple:
+    with np.load(path, allow_pickle=False) as data:
+        header = json.loads(str(data["header"]))
+        arrays = {key: data[key] for key in data.files if key != "header"}
+    if header.get("format") != _FORMAT_VERSION:
+        raise ValueError(f"{path} is not a simulation checkpoint of a supported format.")
+    return header, arrays
+
+
+def _values_path(path: str) -> str:
+    return f"{path}.values.npy"
+
+
+def _open_values(path: str, n_total: int, create: bool) -> np.memmap:
+    """Memory-map the values file of the checkpoint at *path* for writing."""
+
+    values_path = _values_path(path)
+    if create:
+        # Replace rather than truncate: results of an earlier run may still
+        # be mapped from the old file.
+        tmp = f"{values_path}.tmp"
+        values = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float64, shape=(n_total,))
+        os.replace(tmp, values_path)
+        return values
+    values = np.load(values_path, mmap_mode="r+")
+    if values.shape != (n_total,) or values.dtype != np.float64:
+        raise ValueError(f"{values_path} does not match the checkpoint at {path}.")
+    return values
+
+
+def _sketch_arrays(sketch: KLLSketch) -> Dict[str, np.ndarray]:
+    """Sketch contents plus the state of its compaction RNG."""
+
+    return {
+        "sketch": np.frombuffer(sketch.to_bytes(), dtype=np.uint8),
+        "sketch_rng": np.frombuffer(sketch.rng_state(), dtype=np.uint8),
+    }
+
+
+def _restore_sketch(arrays: Dict[str, np.ndarray]) -> KLLSketch:
+    sketch = KLLSketch.from_bytes(arrays["sketch"].tobytes())
+    return sketch.set_rng_state(arrays["sketch_rng"].tobytes())
+
+
+def _run(
+    header: Dict[str, Any],
+    arrays: Dict[str, np.ndarray],
+    generator_factory: GeneratorFactory,
+    statistic: Callable[..., Any],
+    path: str,
+    checkpoint_every: float,
+    statistic_name: str | None,
+    metadata: Dict[str, Any] | None,
+) -> SimulationResult:
+    """Continue the run described by *header* and *arrays* to completion."""
+
+    rng = np.random.default_rng()
+    rng.bit_generator.state = header["rng_state"]
+    sample_generator = generator_factory(rng)
+
+    n_total = header["n_simulations"]
+    filled = header["completed"]
+    if header["streaming"]:
+        if "sketch" in arrays:
+            sketch = _restore_sketch(arrays)
+        else:
+            sketch = KLLSketch(k=header["sketch_k"], seed=0)
+    else:
+        values = _open_values(path, n_total, create=filled == 0)
+
+    def save() -> None:
+        header.update(completed=filled, rng_state=rng.bit_generator.state)
+        if header["streaming"]:
+            _write_checkpoint(path, header, _sketch_arrays(sketch))
+        else:
+            # Values first: the header must never count unwritten values.
+            values.flush()
+            _write_checkpoint(path, header, {})
+
+    chunks: Iterator[np.ndarray] = _iter_value_chunks(
+        sample_generator,
+        statistic,
+        header["sample_size"],
+        n_total - filled,
+        header["vectorized"],
+        header["chunk_size"],
+    )
+    last_saved = time.monotonic()
+    for chunk in chunks:
+        if header["streaming"]:
+            sketch.update_many(chunk.tolist())
+        else:
+            values[filled : filled + chunk.size] = chunk
+        filled += chunk.size
+        if filled < n_total and time.monotonic() - last_saved >= checkpoint_every:
+            save()
+            last_saved = time.monotonic()
+    save()
+
+    run_metadata = dict(metadata or {})
+    run_metadata["seed"] = header["seed"]
+    run_metadata["spawn_key"] = header.get("spawn_key", [])
+    common = dict(
+        statistic_name=statistic_name or getattr(statistic, "__name__", "statistic"),
+        sample_size=header["sample_size"],
+        n_simulations=n_total,
+        metadata=run_metadata,
+    )
+    if header["streaming"]:
+        return SimulationResult(values=[], summary=sketch.summary(), sketch=sketch, **common)
+    return SimulationResult(values=np.load(_values_path(path), mmap_mode="r"), **common)
+
+
+def run_checkpointed_simulation(
+    generator_factory: GeneratorFactory,
+    statistic: Callable[..., Any],
+    sample_size: int,
+    n_simulations: int,
+    checkpoint_path: str | os.PathLike,
+    seed: int | np.random.SeedSequence | None = None,
+    checkpoint_every: float = 60.0,
+    vectorized: bool = False,
+    chunk_size: int | None = None,
+    streaming: bool = False,
+    sketch_k: int = 200,
+    statistic_name: str | None = None,
+    metadata: Dict[str, Any] | None = None,
+) -> SimulationResult:
+    """Run a simulation that can be resumed after an interruption.
+
+    Parameters
+    ----------
+    generator_factory:
+        Callable ``factory(rng) -> sample_generator``, as for
+        :func:`simulation.run_parallel_simulation`. The factory is called
+        once, with a generator seeded from *seed*.
+    statistic, sample_size, n_simulations, vectorized, chunk_size,
+    streaming, sketch_k, statistic_name, metadata:
+        As for :func:`simulation.run_statistic_simulation`.
+    checkpoint_path:
+        File the checkpoint is written to (an existing file is replaced).
+        Without streaming, the values are written to
+        ``<checkpoint_path>.values.npy``. The final state is kept after the
+        run completes, so resuming a finished run simply rebuilds its
+        result.
+    seed:
+        Root seed (an integer or a ``SeedSequence``). If omitted, fresh
+        entropy is used; it is recorded in ``metadata["seed"]`` together
+        with the spawn key in ``metadata["spawn_key"]``.
+    checkpoint_every:
+        Minimum number of seconds between checkpoints; checkpoints are
+        written after whole chunks only. ``0`` checkpoints every chunk.
+
+    Returns
+    -------
+    SimulationResult
+        The same result an uninterrupted run would produce. Without
+        streaming, its values are a read-only memory map of the values
+        file.
+    """
+
+    if sample_size <= 0:
+        raise ValueError("sample_size must be positive.")
+    if n_simulations <= 0:
+        raise ValueError("n_simulations must be positive.")
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    if checkpoint_every < 0:
+        raise ValueError("checkpoint_every must be non-negative.")
+
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    default_chunk = _default_chunk_size(sample_size) if vectorized else _STREAM_CHUNK
+    header = {
+        "format": _FORMAT_VERSION,
+        "sample_size": sample_size,
+        "n_simulations": n_simulations,
+        "chunk_size": chunk_size or default_chunk,
+        "vectorized": vectorized,
+        "streaming": streaming,
+        "sketch_k": sketch_k,
+        "seed": root.entropy,
+        "spawn_key": list(root.spawn_key),
+        "completed": 0,
+        "rng_state": np.random.default_rng(root).bit_generator.state,
+    }
+    return _run(
+        header,
+        {},
+        generator_factory,
+        statistic,
+        os.fspath(checkpoint_path),
+        checkpoint_every,
+        statistic_name,
+        metadata,
+    )
+
+
+def resume_simulation(
+    checkpoint_path: str | os.PathLike,
+    generator_factory: GeneratorFactory,
+    statistic: Callable[..., Any],
+    checkpoint_every: float = 60.0,
+    statistic_name: str | None = None,
+    metadata: Dict[str, Any] | None = None,
+) -> SimulationResult:
+    """Continue a run of :func:`run_checkpointed_simulation`.
+
+    Parameters
+    ----------
+    checkpoint_path:
+        Checkpoint written by the interrupted run.
+    generator_factory, statistic:
+        The same factory and statistic as in the original call.
+    checkpoint_every, statistic_name, metadata:
+        As for :func:`run_checkpointed_simulation`.
+    """
+
+    if checkpoint_every < 0:
+        raise ValueError("checkpoint_every must be non-negative.")
+    path = os.fspath(checkpoint_path)
+    header, arrays = _load_checkpoint(path)
+    return _run(
+        header,
+        arrays,
+        generator_factory,
+        statistic,
+        path,
+        checkpoint_every,
+        statistic_name,
+        metadata,
+    )
+
+
+__all__ = [
+    "run_checkpointed_simulation",
+    "resume_simulation",
+]
@@ -0,0 +1,197 @@
+"""Binary columnar sidecar cache for sales CSV files.
+
+Parsing a large CSV file on every run is slow, while loading raw binary
+columns is almost free. :func:`load_sales_columns` therefore keeps, next to
+each CSV file, a sidecar directory ``<file>.columns/`` holding
+
+- one ``.npy`` file per column (see :data:`sales_data.COLUMN_DTYPES`);
+- ``manifest.json`` with the region dictionary, the row count and a
+  fingerprint of the source file: its size, modification time and
+  SHA-256 digest.
+
+Later loads memory-map the ``.npy`` files, which takes milliseconds
+regardless of the file size. The cache is rebuilt automatically when the
+source file changes: a different size means a rebuild; a different
+modification time alone triggers a hash check, so a touched but unchanged
+file is not parsed again.
+
+The cache is built chunk by chunk with :class:`sales_data.SalesCSVReader`
+and written straight to disk, so building needs no more memory than
+streaming the file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .sales_data import COLUMN_DTYPES, SALES_COLUMNS, SalesColumns, SalesCSVReader
+
+_FORMAT_VERSION = 1
+_MANIFEST = "manifest.json"
+_HASH_BLOCK = 1 << 23
+
+# Every column file starts with a fixed-size NPY version 1.0 header, so the
+# data can be streamed to disk before the final row count is known.
+_NPY_HEADER_BYTES = 128
+
+
+def _npy_header(dtype: np.dtype, rows: int) -> bytes:
+    """NPY 1.0 header for a 1-D C-order array, padded to a fixed size."""
+
+    header = repr(
+        {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (rows,)}
+    )
+    prefix = np.lib.format.MAGIC_PREFIX + bytes([1, 0])
+    body_len = _NPY_HEADER_BYTES - len(prefix) - 2
+    if len(header) + 1 > body_len:
+        raise ValueError(f"NPY header for {rows} rows does not fit in {_NPY_HEADER_BYTES} bytes.")
+    body = header.ljust(body_len - 1).encode("latin1") + b"\n"
+    return prefix + body_len.to_bytes(2, "little") + body
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _fingerprint(path: str, with_hash: bool = True) -> Dict[str, Any]:
+    stat = os.stat(path)
+    fingerprint: Dict[str, Any] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if with_hash:
+        fingerprint["sha256"] = _file_sha256(path)
+    return fingerprint
+
+
+def sidecar_dir(path: str | os.PathLike) -> str:
+    """Default cache directory of the CSV file at *path*."""
+
+    return f"{os.fspath(path)}.columns"
+
+
+def build_sales_cache(
+    path: str | os.PathLike,
+    cache_dir: str | os.PathLike | None = None,
+    chunk_rows: int = 1_000_000,
+) -> str:
+    """Parse *path* and (re)write its columnar cache; return the cache directory."""
+
+    source = os.fspath(path)
+    target = os.fspath(cache_dir) if cache_dir is not None else sidecar_dir(source)
+    building = f"{target}.tmp-{os.getpid()}"
+    shutil.rmtree(building, ignore_errors=True)
+    os.makedirs(building)
+
+    fingerprint = _fingerprint(source)
+    reader = SalesCSVReader(source, chunk_rows)
+    files = {name: open(os.path.join(building, f"{name}.npy"), "wb") for name in SALES_COLUMNS}
+    try:
+        for fh in files.values():
+            fh.seek(_NPY_HEADER_BYTES)
+        for chunk in reader:
+            for name, fh in files.items():
+                fh.write(np.ascontiguousarray(chunk[name]).tobytes())
+        for name, fh in files.items():
+            fh.seek(0)
+            fh.write(_npy_header(COLUMN_DTYPES[name], reader.rows_read))
+    finally:
+        for fh in files.values():
+            fh.close()
+
+    manifest = {
+        "format": _FORMAT_VERSION,
+        "source": fingerprint,
+        "rows": reader.rows_read,
+        "columns": {name: COLUMN_DTYPES[name].str for name in SALES_COLUMNS},
+        "regions": reader.regions,
+    }
+    with open(os.path.join(building, _MANIFEST), "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh)
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(building, target)
+    return target
+
+
+def _read_manifest(cache_dir: str) -> Dict[str, Any] | None:
+    try:
+        with open(os.path.join(cache_dir, _MANIFEST), encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("format") == _FORMAT_VERSION else None
+
+
+def _is_current(source: str, cache_dir: str, manifest: Dict[str, Any]) -> bool:
+    """Check the cached fingerprint; refresh a stale mtime of identical data."""
+
+    cached = manifest["source"]
+    current = _fingerprint(source, with_hash=False)
+    if current["size"] != cached["size"]:
+        return False
+    if current["mtime_ns"] == cached["mtime_ns"]:
+        return True
+    if _file_sha256(source) != cached["sha256"]:
+        return False
+    cached["mtime_ns"] = current["mtime_ns"]
+    with open(os.path.join(cache_dir, _MANIFEST), "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh)
+    return True
+
+
+def load_sales_columns(
+    path: str | os.PathLike,
+    cache_dir: str | os.PathLike | None = None,
+    chunk_rows: int = 1_000_000,
+    mmap_mode: str | None = "r",
+) -> Tuple[SalesColumns, List[str]]:
+    """Load a sales CSV file through its columnar cache.
+
+    Parameters
+    ----------
+    path:
+        The CSV file (schema of :mod:`sales_data`).
+    cache_dir:
+        Cache directory; defaults to :func:`sidecar_dir` of *path*.
+    chunk_rows:
+        Rows per parsed chunk when the cache has to be (re)built.
+    mmap_mode:
+        Passed to :func:`numpy.load`; ``"r"`` (the default) memory-maps the
+        columns read-only, ``None`` reads them into memory.
+
+    Returns
+    -------
+    tuple
+        ``(columns, regions)`` as returned by
+        :func:`sales_data.read_sales_csv`.
+    """
+
+    source = os.fspath(path)
+    target = os.fspath(cache_dir) if cache_dir is not None else sidecar_dir(source)
+    manifest = _read_manifest(target)
+    if manifest is None or not _is_current(source, target, manifest):
+        build_sales_cache(source, target, chunk_rows)
+        manifest = _read_manifest(target)
+        if manifest is None:
+            raise OSError(f"Could not read the columnar cache just written to {target}.")
+
+    columns = {
+        name: np.load(os.path.join(target, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in SALES_COLUMNS
+    }
+    return columns, list(manifest["regions"])
+
+
+__all__ = [
+    "build_sales_cache",
+    "load_sales_columns",
+    "sidecar_dir",
+]
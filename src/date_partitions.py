@@ -0,0 +1,289 @@
+"""Date-partitioned columnar storage with range queries.
+
+Most questions about the sales data concern a date window, e.g. the last
+30 days of ``total_revenue``. Filtering the full dataset with a boolean
+mask touches every row. :class:`DatePartitionStore` instead stores the
+rows split by calendar period (month by default) on disk:
+
+- every partition is a directory of ``.npy`` columns (the schema of
+  :mod:`sales_data`) with rows sorted by date;
+- ``manifest.json`` lists the partitions with their first and last date
+  and the shared region dictionary.
+
+A range query first selects the partitions overlapping the window by
+binary search over the sorted partition bounds, memory-maps only those,
+and finds the first and last matching row of each with
+:func:`numpy.searchsorted` on its sorted date column. The cost depends
+on the rows in the window, not on the size of the store.
+
+New data is added with :meth:`DatePartitionStore.append_csv`. Only the
+partitions that receive rows are rewritten. They are first written next
+to the live ones as ``<partition>.pending``, then listed as pending in
+the saved manifest, and only then swapped in. A store interrupted during
+the swap finishes it when it is next opened, so the manifest and the
+partitions never disagree.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import shutil
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .numpy_stats import np_summary
+from .sales_data import COLUMN_DTYPES, SALES_COLUMNS, SalesColumns, SalesCSVReader
+
+_FORMAT_VERSION = 1
+_MANIFEST = "manifest.json"
+_FREQUENCIES = ("D", "M", "Y")
+
+DateLike = Any
+
+
+def date_slice(dates: np.ndarray, start: DateLike = None, end: DateLike = None) -> slice:
+    """Rows of the sorted *dates* with ``start <= date < end``, as a slice.
+
+    Either bound may be ``None`` for an open end.
+    """
+
+    lo, hi = 0, len(dates)
+    if start is not None:
+        lo = int(np.searchsorted(dates, np.datetime64(start, "D"), side="left"))
+    if end is not None:
+        hi = int(np.searchsorted(dates, np.datetime64(end, "D"), side="left"))
+    return slice(lo, max(lo, hi))
+
+
+class DatePartitionStore:
+    """Sales columns on disk, partitioned by date period.
+
+    Parameters
+    ----------
+    directory:
+        Store directory; created (empty) if it does not exist.
+    freq:
+        Partition period for a new store: ``"D"`` (day), ``"M"`` (month)
+        or ``"Y"`` (year). An existing store keeps its own period.
+
+    Attributes
+    ----------
+    regions:
+        Region dictionary of the ``region`` codes.
+    """
+
+    def __init__(self, directory: str | os.PathLike, freq: str = "M") -> None:
+        self.directory = os.fspath(directory)
+        manifest_path = os.path.join(self.directory, _MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as fh:
+                manifest = json.load(fh)
+            if manifest.get("format") != _FORMAT_VERSION:
+                raise ValueError(f"{self.directory} is not a date partition store.")
+        else:
+            if freq not in _FREQUENCIES:
+                raise ValueError(f"freq must be one of {_FREQUENCIES}.")
+            manifest = {"format": _FORMAT_VERSION, "freq": freq, "regions": [], "partitions": {}}
+            os.makedirs(self.directory, exist_ok=True)
+        self.freq: str = manifest["freq"]
+        self.regions: List[str] = manifest["regions"]
+        self._partitions: Dict[str, Dict[str, Any]] = manifest["partitions"]
+        if manifest.get("pending"):
+            self._swap_in(manifest["pending"])
+        self._refresh_index()
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+    def _refresh_index(self) -> None:
+        self._names = sorted(self._partitions, key=lambda name: self._partitions[name]["min"])
+        self._mins = [self._partitions[name]["min"] for name in self._names]
+        self._maxs = [self._partitions[name]["max"] for name in self._names]
+
+    def _save_manifest(self, pending: Sequence[str] = ()) -> None:
+        manifest = {
+            "format": _FORMAT_VERSION,
+            "freq": self.freq,
+            "regions": self.regions,
+            "partitions": self._partitions,
+            "pending": list(pending),
+        }
+        path = os.path.join(self.directory, _MANIFEST)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh)
+        os.replace(f"{path}.tmp", path)
+
+    @property
+    def partitions(self) -> List[str]:
+        """Partition names in date order (e.g. ``"2024-01"`` for monthly)."""
+
+        return list(self._names)
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the store."""
+
+        return sum(part["rows"] for part in self._partitions.values())
+
+    def partitions_for(self, start: DateLike = None, end: DateLike = None) -> List[str]:
+        """Partitions that may hold rows with ``start <= date < end``."""
+
+        # Partitions do not overlap, so both bound lists are sorted.
+        lo, hi = 0, len(self._names)
+        if start is not None:
+            lo = bisect.bisect_left(self._maxs, str(np.datetime64(start, "D")))
+        if end is not None:
+            hi = bisect.bisect_left(self._mins, str(np.datetime64(end, "D")))
+        return self._names[lo:hi]
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def _load_partition(self, name: str, mmap_mode: str | None) -> SalesColumns:
+        base = os.path.join(self.directory, name)
+        return {
+            column: np.load(os.path.join(base, f"{column}.npy"), mmap_mode=mmap_mode)
+            for column in SALES_COLUMNS
+        }
+
+    def _write_partition(self, name: str, parts: List[SalesColumns]) -> Dict[str, Any]:
+        """Write partition *name* merged with *parts*, sorted by date, as pending.
+
+        Returns the manifest entry of the new partition.
+        """
+
+        if name in self._partitions:
+            parts = [self._load_partition(name, None)] + parts
+        columns = {col: np.concatenate([p[col] for p in parts]) for col in SALES_COLUMNS}
+        order = np.argsort(columns["date"], kind="stable")
+
+        building = os.path.join(self.directory, f"{name}.pending")
+        shutil.rmtree(building, ignore_errors=True)
+        os.makedirs(building)
+        for col in SALES_COLUMNS:
+            np.save(os.path.join(building, f"{col}.npy"), columns[col][order])
+
+        dates = columns["date"][order]
+        return {"rows": int(dates.size), "min": str(dates[0]), "max": str(dates[-1])}
+
+    def _swap_in(self, names: Sequence[str]) -> None:
+        """Replace partitions *names* by their pending versions, then clear the list.
+
+        Safe to repeat: a partition whose pending directory is gone has
+        already been swapped in.
+        """
+
+        for name in names:
+            base = os.path.join(self.directory, name)
+            building = f"{base}.pending"
+            if os.path.isdir(building):
+                shutil.rmtree(base, ignore_errors=True)
+                os.replace(building, base)
+        self._save_manifest()
+
+    def _split_by_partition(
+        self, chunks: Iterable[SalesColumns]
+    ) -> Tuple[Dict[str, List[SalesColumns]], int]:
+        """Group the rows of *chunks* by partition name."""
+
+        pending: Dict[str, List[SalesColumns]] = {}
+        added = 0
+        for chunk in chunks:
+            periods = chunk["date"].astype(f"datetime64[{self.freq}]")
+            order = np.argsort(periods, kind="stable")
+            keys, starts = np.unique(periods[order], return_index=True)
+            bounds = list(starts[1:]) + [periods.size]
+            for key, lo, hi in zip(keys, starts, bounds):
+                rows = order[lo:hi]
+                pending.setdefault(str(key), []).append(
+                    {col: chunk[col][rows] for col in SALES_COLUMNS}
+                )
+            added += periods.size
+        return pending, added
+
+    def _commit(self, pending: Dict[str, List[SalesColumns]]) -> None:
+        entries = {name: self._write_partition(name, parts) for name, parts in pending.items()}
+        self._partitions.update(entries)
+        # From here on the new partitions are the store's state; a crash
+        # before the swap below completes is finished on the next open.
+        self._save_manifest(pending=list(entries))
+        self._swap_in(list(entries))
+        self._refresh_index()
+
+    def append_columns(self, chunks: Iterable[SalesColumns]) -> int:
+        """Add chunks of typed columns whose region codes refer to :attr:`regions`.
+
+        Rows are grouped by partition first, so each touched partition is
+        rewritten once. Returns the number of rows added.
+        """
+
+        pending, added = self._split_by_partition(chunks)
+        self._commit(pending)
+        return added
+
+    def append_csv(self, path: str | os.PathLike, chunk_rows: int = 1_000_000) -> int:
+        """Parse a sales CSV file and add its rows; return the number added.
+
+        Rows are buffered per partition until the whole file is read, so
+        memory use grows with the new rows plus the largest touched
+        partition, not with the size of the store. A file that fails to
+        parse leaves the store, including its region dictionary, unchanged.
+        """
+
+        reader = SalesCSVReader(path, chunk_rows, regions=self.regions)
+        pending, added = self._split_by_partition(reader)
+        self.regions = reader.regions
+        self._commit(pending)
+        return added
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def query(
+        self,
+        start: DateLike = None,
+        end: DateLike = None,
+        columns: Sequence[str] = SALES_COLUMNS,
+    ) -> SalesColumns:
+        """Rows with ``start <= date < end`` (either bound may be ``None``).
+
+        Only the overlapping partitions are opened (memory-mapped). When the
+        window lies within one partition, the returned columns are views of
+        its memory maps; otherwise the selected rows are concatenated.
+        """
+
+        for col in columns:
+            if col not in SALES_COLUMNS:
+                raise ValueError(f"Unknown sales column {col!r}.")
+        pieces: Dict[str, List[np.ndarray]] = {col: [] for col in columns}
+        for name in self.partitions_for(start, end):
+            part = self._load_partition(name, "r")
+            rows = date_slice(part["date"], start, end)
+            for col in columns:
+                pieces[col].append(part[col][rows])
+
+        result = {}
+        for col in columns:
+            if len(pieces[col]) == 1:
+                result[col] = pieces[col][0]
+            elif pieces[col]:
+                result[col] = np.concatenate(pieces[col])
+            else:
+                result[col] = np.empty(0, dtype=COLUMN_DTYPES[col])
+        return result
+
+    def summary(
+        self, column: str, start: DateLike = None, end: DateLike = None
+    ) -> Dict[str, float]:
+        """:func:`numpy_stats.np_summary` of *column* over a date window."""
+
+        return np_summary(self.query(start, end, columns=(column,))[column])
+
+
+__all__ = [
+    "DatePartitionStore",
+    "date_slice",
+]
@@ -0,0 +1,154 @@
+"""Preallocated, vectorized sample generators.
+
+A plain ``lambda n: rng.normal(size=n)`` generator allocates a fresh array
+on every call. The generator objects in this module can instead *fill* a
+caller-provided buffer in place via :meth:`DistributionGenerator.fill`,
+using the ``out=`` arguments of :class:`numpy.random.Generator`.
+:func:`simulation.run_statistic_simulation` detects this and allocates a
+single sample buffer (scalar mode) or block buffer (vectorized mode) that
+is refilled for every replicate or block.
+
+Every generator is also callable like an ordinary sample generator,
+``gen(n)`` or ``gen((rows, n))``, returning a newly allocated array, so it
+can be used anywhere a ``SampleGenerator`` is expected.
+
+Available generators: :class:`NormalGenerator`, :class:`UniformGenerator`,
+:class:`ExponentialGenerator`, :class:`PoissonGenerator` and
+:class:`BootstrapGenerator` (resampling with replacement from a dataset).
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from .numpy_stats import _to_ndarray
+
+Seed = int | np.random.Generator | np.random.SeedSequence | None
+
+
+class DistributionGenerator(ABC):
+    """Base class for generators that can fill preallocated buffers.
+
+    Parameters
+    ----------
+    seed:
+        Seed, ``SeedSequence`` or existing ``numpy.random.Generator``
+        (shared, not copied).
+    """
+
+    def __init__(self, seed: Seed = None) -> None:
+        self.rng = np.random.default_rng(seed)
+
+    @abstractmethod
+    def fill(self, out: np.ndarray) -> np.ndarray:
+        """Overwrite the float64 array *out* with fresh draws and return it."""
+
+    def __call__(self, size: int | Tuple[int, ...]) -> np.ndarray:
+        return self.fill(np.empty(size, dtype=float))
+
+
+class NormalGenerator(DistributionGenerator):
+    """Normal(``loc``, ``scale``) draws."""
+
+    def __init__(self, loc: float = 0.0, scale: float = 1.0, seed: Seed = None) -> None:
+        super().__init__(seed)
+        self.loc = float(loc)
+        self.scale = float(scale)
+
+    def fill(self, out: np.ndarray) -> np.ndarray:
+        self.rng.standard_normal(out=out)
+        if self.scale != 1.0:
+            out *= self.scale
+        if self.loc != 0.0:
+            out += self.loc
+        return out
+
+
+class UniformGenerator(DistributionGenerator):
+    """Uniform(``low``, ``high``) draws."""
+
+    def __init__(self, low: float = 0.0, high: float = 1.0, seed: Seed = None) -> None:
+        super().__init__(seed)
+        self.low = float(low)
+        self.high = float(high)
+
+    def fill(self, out: np.ndarray) -> np.ndarray:
+        self.rng.random(out=out)
+        out *= self.high - self.low
+        out += self.low
+        return out
+
+
+class ExponentialGenerator(DistributionGenerator):
+    """Exponential draws with mean ``scale``."""
+
+    def __init__(self, scale: float = 1.0, seed: Seed = None) -> None:
+        super().__init__(seed)
+        self.scale = float(scale)
+
+    def fill(self, out: np.ndarray) -> np.ndarray:
+        self.rng.standard_exponential(out=out)
+        if self.scale != 1.0:
+            out *= self.scale
+        return out
+
+
+class PoissonGenerator(DistributionGenerator):
+    """Poisson(``lam``) counts, stored as floats.
+
+    NumPy has no ``out=`` variant for Poisson draws, so :meth:`fill` draws
+    into a temporary integer array and copies it into *out*.
+    """
+
+    def __init__(self, lam: float = 1.0, seed: Seed = None) -> None:
+        super().__init__(seed)
+        if lam < 0:
+            raise ValueError("lam must be non-negative.")
+        self.lam = float(lam)
+
+    def fill(self, out: np.ndarray) -> np.ndarray:
+        out[...] = self.rng.poisson(self.lam, size=out.shape)
+        return out
+
+
+class BootstrapGenerator(DistributionGenerator):
+    """Resample with replacement from an empirical dataset.
+
+    Indices are computed from uniforms in a reusable integer buffer and
+    gathered with :func:`numpy.take` directly into *out*, so repeated fills
+    of same-sized buffers allocate nothing.
+    """
+
+    def __init__(self, data: Iterable[float], seed: Seed = None) -> None:
+        super().__init__(seed)
+        self.data = np.ascontiguousarray(_to_ndarray(data), dtype=float).ravel()
+        self._uniforms = np.empty(0, dtype=float)
+        self._indices = np.empty(0, dtype=np.intp)
+
+    def fill(self, out: np.ndarray) -> np.ndarray:
+        size = out.size
+        if self._indices.size < size:
+            self._uniforms = np.empty(size, dtype=float)
+            self._indices = np.empty(size, dtype=np.intp)
+        u = self._uniforms[:size]
+        idx = self._indices[:size]
+        self.rng.random(out=u)
+        u *= self.data.size
+        np.copyto(idx, u, casting="unsafe")
+        # "clip" guards the (measure-zero) u * n == n rounding case and lets
+        # NumPy write straight into *out* without an intermediate buffer.
+        np.take(self.data, idx.reshape(out.shape), out=out, mode="clip")
+        return out
+
+
+__all__ = [
+    "DistributionGenerator",
+    "NormalGenerator",
+    "UniformGenerator",
+    "ExponentialGenerator",
+    "PoissonGenerator",
+    "BootstrapGenerator",
+]
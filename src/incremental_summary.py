@@ -0,0 +1,251 @@
+"""Persisted, incrementally updated summaries of append-only sales data.
+
+Recomputing every summary over the full history each time a new day of
+sales arrives costs time proportional to the whole history.
+:class:`IncrementalSalesSummary` instead keeps a small mergeable state:
+one :class:`quantile_sketch.KLLSketch` per value column, overall and per
+group (by default per region and per store). Each sketch tracks exact
+count, mean, variance, minimum and maximum plus approximate quantiles,
+and new rows are simply folded in, so
+
+- :meth:`IncrementalSalesSummary.append_csv` costs time proportional to
+  the rows of the new file only;
+- :meth:`IncrementalSalesSummary.summary` and
+  :meth:`IncrementalSalesSummary.grouped_summary` answer from the state
+  without rescanning any data.
+
+The state is saved with :meth:`IncrementalSalesSummary.save` as an
+``.npz`` archive (JSON header plus the sketches'
+:meth:`~quantile_sketch.KLLSketch.to_bytes` blobs; no pickling) and
+reopened with :meth:`IncrementalSalesSummary.load`. Files already folded
+in are recognized by their SHA-256 digest and skipped.
+
+Example::
+
+    state = IncrementalSalesSummary.load("sales_state.npz")
+    state.append_csv("sales_2024-06-01.csv")
+    state.save("sales_state.npz")
+    state.grouped_summary("total_revenue", by="region")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, Hashable, List, Sequence
+
+import numpy as np
+
+from .columnar_cache import _file_sha256
+from .grouped_stats import factorize
+from .quantile_sketch import KLLSketch
+from .sales_data import SALES_COLUMNS, SalesColumns, SalesCSVReader
+
+_FORMAT_VERSION = 1
+
+Groups = Dict[Hashable, Dict[str, KLLSketch]]
+
+
+class IncrementalSalesSummary:
+    """Mergeable summary state of sales columns, overall and per group.
+
+    Parameters
+    ----------
+    columns:
+        Value columns to summarize.
+    group_by:
+        Key columns to summarize by; each is grouped separately. Region
+        groups are keyed by region name, date groups by ISO date string.
+    sketch_k:
+        Accuracy parameter of every sketch.
+
+    Attributes
+    ----------
+    regions:
+        Region dictionary shared with :class:`sales_data.SalesCSVReader`.
+    files:
+        SHA-256 digests of the CSV files folded in so far.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str] = ("items_sold", "total_revenue"),
+        group_by: Sequence[str] = ("region", "store_id"),
+        sketch_k: int = 200,
+    ) -> None:
+        for name in list(columns) + list(group_by):
+            if name not in SALES_COLUMNS:
+                raise ValueError(f"Unknown sales column {name!r}.")
+        self.columns = tuple(columns)
+        self.group_by = tuple(group_by)
+        self.sketch_k = int(sketch_k)
+        self.regions: List[str] = []
+        self.files: List[str] = []
+        self._overall = {name: KLLSketch(self.sketch_k) for name in self.columns}
+        self._groups: Dict[str, Groups] = {key: {} for key in self.group_by}
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows folded into the state."""
+
+        return self._overall[self.columns[0]].count if self.columns else 0
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def _group_sketches(self, key: str, group: Hashable) -> Dict[str, KLLSketch]:
+        groups = self._groups[key]
+        if group not in groups:
+            groups[group] = {name: KLLSketch(self.sketch_k) for name in self.columns}
+        return groups[group]
+
+    def append_columns(self, chunk: SalesColumns) -> None:
+        """Fold one chunk of typed columns (see :mod:`sales_data`) into the state.
+
+        Region codes must refer to :attr:`regions`.
+        """
+
+        for name in self.columns:
+            self._overall[name].update_many(chunk[name].tolist())
+
+        for key in self.group_by:
+            codes, (uniques,) = factorize(chunk[key])
+            order = np.argsort(codes, kind="stable")
+            bounds = np.cumsum(np.bincount(codes, minlength=uniques.size))[:-1]
+            parts = {name: np.split(chunk[name][order], bounds) for name in self.columns}
+            for g, group in enumerate(uniques.tolist()):
+                if key == "region":
+                    label = self.regions[group]
+                elif key == "date":
+                    label = str(group)
+                else:
+                    label = group
+                sketches = self._group_sketches(key, label)
+                for name in self.columns:
+                    sketches[name].update_many(parts[name][g].tolist())
+
+    def append_csv(self, path: str | os.PathLike, chunk_rows: int = 1_000_000) -> int:
+        """Fold a sales CSV file into the state, chunk by chunk.
+
+        The chunks are folded into a scratch state that is merged in only
+        once the whole file has been parsed, so a file that fails partway
+        leaves the state unchanged and can be added again after fixing it.
+
+        Returns
+        -------
+        int
+            Number of rows added; ``0`` if the file had already been added.
+        """
+
+        digest = _file_sha256(os.fspath(path))
+        if digest in self.files:
+            return 0
+        reader = SalesCSVReader(path, chunk_rows, regions=self.regions)
+        staged = IncrementalSalesSummary(self.columns, self.group_by, self.sketch_k)
+        # The reader extends its region list while parsing; share it.
+        staged.regions = reader.regions
+        for chunk in reader:
+            staged.append_columns(chunk)
+
+        self.regions = reader.regions
+        for name, sketch in staged._overall.items():
+            self._overall[name].merge(sketch)
+        for key, groups in staged._groups.items():
+            for group, sketches in groups.items():
+                mine = self._group_sketches(key, group)
+                for name, sketch in sketches.items():
+                    mine[name].merge(sketch)
+        self.files.append(digest)
+        return reader.rows_read
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def sketch(self, column: str, by: str | None = None, group: Hashable = None) -> KLLSketch:
+        """The sketch of *column*, overall or for one *group* of key *by*."""
+
+        if column not in self._overall:
+            raise KeyError(f"Column {column!r} is not summarized.")
+        if by is None:
+            return self._overall[column]
+        if by not in self._groups:
+            raise KeyError(f"State is not grouped by {by!r}.")
+        return self._groups[by][group][column]
+
+    def summary(self, column: str) -> Dict[str, float]:
+        """Summary of *column* over all rows (keys of :func:`numpy_stats.np_summary`)."""
+
+        return self.sketch(column).summary()
+
+    def grouped_summary(self, column: str, by: str) -> Dict[Hashable, Dict[str, float]]:
+        """Summary of *column* for every group of *by*, in sorted group order."""
+
+        self.sketch(column)
+        if by not in self._groups:
+            raise KeyError(f"State is not grouped by {by!r}.")
+        groups = self._groups[by]
+        return {group: groups[group][column].summary() for group in sorted(groups)}
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: str | os.PathLike) -> None:
+        """Atomically write the state to *path* (an ``.npz`` archive)."""
+
+        entries: List[List[Any]] = []
+        blobs: List[bytes] = []
+        for name, sketch in self._overall.items():
+            entries.append([None, None, name])
+            blobs.append(sketch.to_bytes())
+        for key, groups in self._groups.items():
+            for group, sketches in groups.items():
+                for name, sketch in sketches.items():
+                    entries.append([key, group, name])
+                    blobs.append(sketch.to_bytes())
+
+        header = {
+            "format": _FORMAT_VERSION,
+            "columns": list(self.columns),
+            "group_by": list(self.group_by),
+            "sketch_k": self.sketch_k,
+            "regions": self.regions,
+            "files": self.files,
+            "entries": entries,
+        }
+        offsets = np.cumsum([0] + [len(blob) for blob in blobs], dtype=np.int64)
+        target = os.fspath(path)
+        with open(f"{target}.tmp", "wb") as fh:
+            np.savez(
+                fh,
+                header=np.array(json.dumps(header)),
+                sketches=np.frombuffer(b"".join(blobs), dtype=np.uint8),
+                offsets=offsets,
+            )
+        os.replace(f"{target}.tmp", target)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "IncrementalSalesSummary":
+        """Reopen a state written by :meth:`save`."""
+
+        with np.load(os.fspath(path), allow_pickle=False) as data:
+            header = json.loads(str(data["header"]))
+            blob = data["sketches"].tobytes()
+            offsets = data["offsets"].tolist()
+        if header.get("format") != _FORMAT_VERSION:
+            raise ValueError(f"{os.fspath(path)} is not a saved sales summary state.")
+
+        state = cls(header["columns"], header["group_by"], header["sketch_k"])
+        state.regions = header["regions"]
+        state.files = header["files"]
+        for i, (key, group, name) in enumerate(header["entries"]):
+            sketch = KLLSketch.from_bytes(blob[offsets[i] : offsets[i + 1]])
+            if key is None:
+                state._overall[name] = sketch
+            else:
+                state._group_sketches(key, group)[name] = sketch
+        return state
+
+
+__all__ = [
+    "IncrementalSalesSummary",
+]
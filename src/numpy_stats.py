@@ -7,7 +7,7 @@ for validating the pure-Python versions.
 
 from __future__ import annotations
 
-from typing import Iterable, Dict
+from typing import Any, Iterable, Dict
 
 import numpy as np
 
@@ -15,13 +15,34 @@ import numpy as np
 def _to_ndarray(values: Iterable[float]) -> np.ndarray:
     """Convert *values* to a one-dimensional float NumPy array.
 
+    Inputs that already hold their data contiguously are wrapped without
+    copying whenever their dtype is already ``float64``:
+
+    - NumPy arrays and objects exposing ``__array__`` (e.g. pandas Series);
+    - objects supporting the buffer protocol (``array.array``,
+      ``memoryview``, ...).
+
+    Lists and tuples are converted directly; only genuine iterators (e.g.
+    generators) are first materialized as a list.
+
+    The returned array may share memory with *values* and may be
+    read-only; callers must not modify it in place.
+
     Raises
     ------
     ValueError
         If the sequence is empty.
     """
 
-    arr = np.asarray(list(values), dtype=float)
+    if isinstance(values, (np.ndarray, list, tuple)) or hasattr(values, "__array__"):
+        arr = np.asarray(values, dtype=float)
+    else:
+        try:
+            view = memoryview(values)  # type: ignore[arg-type]
+        except TypeError:
+            arr = np.asarray(list(values), dtype=float)
+        else:
+            arr = np.asarray(view, dtype=float)
     if arr.size == 0:
         raise ValueError("Cannot compute statistic on an empty sequence.")
     return arr
@@ -85,6 +106,26 @@ def np_quantile(values: Iterable[float], q: float) -> float:
     return float(np.quantile(arr, q))
 
 
+def np_quantiles(values: Iterable[float], qs: Iterable[float]) -> np.ndarray:
+    """Return several quantiles of *values* in a single NumPy call.
+
+    The input is converted once and all requested order statistics are
+    obtained from one partition, instead of one conversion and partition
+    per call of :func:`np_quantile`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Float array with one value per entry of *qs*, in the same order.
+    """
+
+    probs = np.asarray(list(qs), dtype=float)
+    if np.any((probs < 0.0) | (probs > 1.0)) or np.any(np.isnan(probs)):
+        raise ValueError("q must be between 0 and 1 inclusive.")
+    arr = _to_ndarray(values)
+    return np.quantile(arr, probs)
+
+
 def np_iqr(values: Iterable[float]) -> float:
     """Return the interquartile range (IQR) of *values* using NumPy."""
 
@@ -137,6 +178,60 @@ def np_summary(values: Iterable[float]) -> Dict[str, float]:
     }
 
 
+def np_summary_batch(matrix: Any, axis: int = 1) -> Dict[str, np.ndarray]:
+    """Return :func:`np_summary` for every row (or column) of a 2-D array.
+
+    All fields are computed with vectorized reductions along *axis*, so
+    summarizing thousands of series costs a handful of NumPy calls instead
+    of a Python loop over :func:`np_summary`.
+
+    Parameters
+    ----------
+    matrix:
+        Two-dimensional array-like of numeric values.
+    axis:
+        Axis along which each series runs. With the default ``axis=1``
+        every row is one series; use ``axis=0`` to summarize columns.
+
+    Returns
+    -------
+    dict of str to numpy.ndarray
+        The same keys as :func:`np_summary`, each mapped to a float array
+        with one entry per series (columnar layout).
+
+    Raises
+    ------
+    ValueError
+        If *matrix* is not two-dimensional, or a series has fewer than two
+        observations.
+    """
+
+    arr = np.asarray(matrix, dtype=float)
+    if arr.ndim != 2:
+        raise ValueError(f"np_summary_batch expects a 2-D array, got {arr.ndim}-D.")
+    if axis not in (0, 1, -1, -2):
+        raise ValueError("axis must be 0 or 1.")
+    n = arr.shape[axis]
+    if n < 2:
+        raise ValueError(f"variance requires at least 2 data points, got {n}.")
+
+    q25, q50, q75 = np.quantile(arr, [0.25, 0.5, 0.75], axis=axis)
+    lo = arr.min(axis=axis)
+    hi = arr.max(axis=axis)
+    return {
+        "count": np.full(lo.shape, float(n)),
+        "mean": arr.mean(axis=axis),
+        "std": arr.std(axis=axis, ddof=1),
+        "min": lo,
+        "q25": q25,
+        "median": q50,
+        "q75": q75,
+        "max": hi,
+        "iqr": q75 - q25,
+        "range": hi - lo,
+    }
+
+
 __all__ = [
     "np_mean",
     "np_median",
@@ -146,8 +241,10 @@ __all__ = [
     "np_variance",
     "np_std",
     "np_quantile",
+    "np_quantiles",
     "np_iqr",
     "np_covariance",
     "np_correlation",
     "np_summary",
+    "np_summary_batch",
 ]
@@ -13,11 +13,13 @@ Design notes
 - Missing values (``None`` or ``float('nan')``) are **not** automatically
   filtered; callers should clean their data beforehand if needed.
 - The implementations are not optimized for very large datasets; they are
-  aimed at clarity rather than performance.
+  aimed at clarity rather than performance. For data that does not fit
+  in memory, see the streaming accumulators in :mod:`running_stats`.
 """
 
 from __future__ import annotations
 
+from itertools import islice
 from typing import Iterable, List, Sequence, Tuple, Dict
 
 
@@ -46,6 +48,182 @@ def _to_list(values: Iterable[float]) -> List[float]:
     return data
 
 
+def _interpolate_sorted(data: Sequence[float], q: float) -> float:
+    """Return the *q*-quantile of an already **sorted** sequence.
+
+    Shared by :func:`quantile` and :func:`summary` so that every order
+    statistic uses the same linear interpolation rule.
+    """
+
+    n = len(data)
+    if n == 1:
+        return data[0]
+
+    pos = q * (n - 1)
+    lower_index = int(pos)
+    upper_index = min(lower_index + 1, n - 1)
+    weight = pos - lower_index
+
+    lower = data[lower_index]
+    upper = data[upper_index]
+
+    return lower * (1.0 - weight) + upper * weight
+
+
+# Below this size a selection sub-problem is finished with a plain sort.
+_SELECT_CUTOFF = 1024
+
+
+def _median_of_medians(data: Sequence[float]) -> float:
+    """Return a pivot guaranteed to lie between the 30th and 70th percentile.
+
+    Used as the fallback pivot rule of :func:`_select` once cheap
+    median-of-three pivots have failed to shrink the problem quickly enough.
+    """
+
+    medians = [
+        sorted(data[i : i + 5])[(min(5, len(data) - i) - 1) // 2]
+        for i in range(0, len(data), 5)
+    ]
+    if len(medians) <= _SELECT_CUTOFF:
+        return sorted(medians)[(len(medians) - 1) // 2]
+    return _select(medians, (len(medians) - 1) // 2, False)[0]
+
+
+def _select(data: List[float], k: int, with_next: bool) -> Tuple[float, float]:
+    """Return the ``k``-th smallest element of *data* (and optionally the next).
+
+    Introselect: quickselect with median-of-three pivots and a three-way
+    partition, switching to median-of-medians pivots once the number of
+    rounds exceeds ``2 * log2(n)``. Partitions are built with list
+    comprehensions, so *data* itself is left untouched.
+
+    When *with_next* is true the second element of the returned pair is the
+    ``(k + 1)``-th smallest element (or the ``k``-th one if ``k`` is the
+    last index), which is what linear interpolation needs.
+    """
+
+    budget = 2 * len(data).bit_length()
+    while True:
+        n = len(data)
+        if n <= _SELECT_CUTOFF:
+            ordered = sorted(data)
+            return ordered[k], ordered[min(k + 1, n - 1)]
+
+        if budget > 0:
+            budget -= 1
+            pivot = sorted((data[0], data[n // 2], data[-1]))[1]
+        else:
+            pivot = _median_of_medians(data)
+
+        lows = [x for x in data if x < pivot]
+        n_low = len(lows)
+        if k < n_low:
+            if with_next and k + 1 == n_low:
+                return max(lows), pivot
+            data = lows
+            continue
+
+        highs = [x for x in data if x > pivot]
+        n_le = n - len(highs)
+        if k < n_le:
+            if with_next and k + 1 == n_le and highs:
+                return pivot, min(highs)
+            return pivot, pivot
+
+        k -= n_le
+        data = highs
+
+
+def _select_inplace(data: List[float], k: int, with_next: bool) -> Tuple[float, float]:
+    """In-place variant of :func:`_select` using Hoare partitioning.
+
+    On return ``data[k]`` holds the ``k``-th smallest element, every element
+    before it is ``<=`` and every element after it is ``>=``.
+    """
+
+    n = len(data)
+    lo, hi = 0, n - 1
+    budget = 2 * n.bit_length()
+    while hi - lo >= _SELECT_CUTOFF:
+        if budget > 0:
+            budget -= 1
+            pivot = sorted((data[lo], data[(lo + hi) // 2], data[hi]))[1]
+        else:
+            pivot = _median_of_medians(data[lo : hi + 1])
+
+        i, j = lo, hi
+        while i <= j:
+            while data[i] < pivot:
+                i += 1
+            while data[j] > pivot:
+                j -= 1
+            if i <= j:
+                data[i], data[j] = data[j], data[i]
+                i += 1
+                j -= 1
+
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            break
+    else:
+        data[lo : hi + 1] = sorted(data[lo : hi + 1])
+
+    value = data[k]
+    if not with_next or k + 1 >= n:
+        return value, value
+    return value, min(islice(data, k + 1, None))
+
+
+def select_kth(values: Iterable[float], k: int, inplace: bool = False) -> float:
+    """Return the ``k``-th smallest element (0-based) of *values*.
+
+    Uses introselect, which runs in expected linear time and never degrades
+    beyond ``O(n log n)``, instead of sorting the full dataset.
+
+    Parameters
+    ----------
+    values:
+        Iterable of numeric observations. With ``inplace=True`` this must be
+        a ``list`` owned by the caller; it is partially reordered so that
+        ``values[k]`` holds the result, smaller elements precede it and
+        larger elements follow it. No copy of the data is made.
+    k:
+        Rank of the requested order statistic, ``0 <= k < len(values)``.
+    inplace:
+        Partition the caller's list instead of working on a copy.
+
+    Raises
+    ------
+    ValueError
+        If *values* is empty or *k* is out of range.
+    TypeError
+        If ``inplace=True`` and *values* is not a list.
+    """
+
+    data = _as_work_list(values, inplace)
+    if not 0 <= k < len(data):
+        raise ValueError(f"k must be between 0 and {len(data) - 1}, got {k}.")
+    if inplace:
+        return _select_inplace(data, k, False)[0]
+    return _select(data, k, False)[0]
+
+
+def _as_work_list(values: Iterable[float], inplace: bool) -> List[float]:
+    """Return the buffer a selection routine may work on."""
+
+    if not inplace:
+        return _to_list(values)
+    if not isinstance(values, list):
+        raise TypeError("inplace=True requires a list of values.")
+    if not values:
+        raise ValueError("Cannot compute statistic on an empty sequence.")
+    return values
+
+
 def mean(values: Iterable[float]) -> float:
     """Return the arithmetic mean of *values*.
 
@@ -60,22 +238,28 @@ def mean(values: Iterable[float]) -> float:
     return total / len(data)
 
 
-def median(values: Iterable[float]) -> float:
+def median(values: Iterable[float], inplace: bool = False) -> float:
     """Return the median of *values*.
 
     For an odd number of observations, the middle value is returned.
     For an even number of observations, the average of the two middle
     values is returned.
+
+    The middle element(s) are found by selection (see :func:`select_kth`)
+    rather than a full sort. With ``inplace=True`` *values* must be a list,
+    which is partially reordered instead of copied.
     """
 
-    data = sorted(_to_list(values))
+    data = _as_work_list(values, inplace)
     n = len(data)
     mid = n // 2
+    select = _select_inplace if inplace else _select
 
     if n % 2 == 1:  # odd
-        return data[mid]
+        return select(data, mid, False)[0]
     # even
-    return (data[mid - 1] + data[mid]) / 2.0
+    lower, upper = select(data, mid - 1, True)
+    return (lower + upper) / 2.0
 
 
 def minimum(values: Iterable[float]) -> float:
@@ -86,7 +270,7 @@ def minimum(values: Iterable[float]) -> float:
     """
 
     data = _to_list(values)
-    m = data
+    m = data[0]
     for x in data[1:]:
         if x < m:
             m = x
@@ -101,7 +285,7 @@ def maximum(values: Iterable[float]) -> float:
     """
 
     data = _to_list(values)
-    m = data
+    m = data[0]
     for x in data[1:]:
         if x > m:
             m = x
@@ -159,7 +343,7 @@ def std_dev(values: Iterable[float], ddof: int = 1) -> float:
     return sqrt(variance(values, ddof=ddof))
 
 
-def quantile(values: Iterable[float], q: float) -> float:
+def quantile(values: Iterable[float], q: float, inplace: bool = False) -> float:
     """Return the *q*-quantile of *values* using linear interpolation.
 
     Parameters
@@ -169,33 +353,62 @@ def quantile(values: Iterable[float], q: float) -> float:
     q:
         Quantile in the closed interval [0, 1]. For example, ``q=0.5``
         yields the median.
+    inplace:
+        If ``True``, *values* must be a list, which is partially reordered
+        instead of copied (see :func:`select_kth`).
 
     Notes
     -----
     This implementation follows a simple linear interpolation between
     sorted data points, similar to NumPy's ``method='linear'`` for
-    :func:`numpy.quantile`.
+    :func:`numpy.quantile`. The two neighbouring order statistics are
+    found by selection in expected linear time instead of sorting.
     """
 
     if not 0.0 <= q <= 1.0:
         raise ValueError("q must be between 0 and 1 inclusive.")
 
-    data = sorted(_to_list(values))
+    data = _as_work_list(values, inplace)
     n = len(data)
-    if n == 1:
-        return data
-
     pos = q * (n - 1)
     lower_index = int(pos)
-    upper_index = min(lower_index + 1, n - 1)
     weight = pos - lower_index
 
-    lower = data[lower_index]
-    upper = data[upper_index]
+    select = _select_inplace if inplace else _select
+    lower, upper = select(data, lower_index, True)
 
     return lower * (1.0 - weight) + upper * weight
 
 
+def quantiles(values: Iterable[float], qs: Iterable[float]) -> List[float]:
+    """Return several quantiles of *values* from a single sort.
+
+    Equivalent to ``[quantile(values, q) for q in qs]`` but the data is
+    materialized and sorted only once, however many probabilities are
+    requested (e.g. all nine deciles).
+
+    Parameters
+    ----------
+    values:
+        Iterable of numeric observations.
+    qs:
+        Iterable of quantiles, each in the closed interval [0, 1].
+
+    Returns
+    -------
+    list of float
+        One value per entry of *qs*, in the same order.
+    """
+
+    probs = list(qs)
+    for q in probs:
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1 inclusive.")
+
+    data = sorted(_to_list(values))
+    return [_interpolate_sorted(data, q) for q in probs]
+
+
 def iqr(values: Iterable[float]) -> float:
     """Return the interquartile range (IQR = Q3 - Q1) of *values*."""
 
@@ -276,20 +489,58 @@ def summary(values: Iterable[float]) -> Dict[str, float]:
     - ``max``
     - ``iqr``
     - ``range``
+
+    Notes
+    -----
+    The data is sorted exactly once; all order statistics (min, max,
+    quartiles, median) are read from that single sorted buffer, and the
+    mean and variance are accumulated together in one further pass.
+    Calling :func:`quantile`, :func:`median`, :func:`iqr`, etc. one by one
+    would instead sort the data once per call.
+
+    Raises
+    ------
+    ValueError
+        If fewer than two values are given (the sample standard deviation
+        is undefined).
     """
 
-    data = _to_list(values)
+    from math import sqrt
+
+    data = sorted(_to_list(values))
+    n = len(data)
+    if n < 2:
+        raise ValueError(f"variance requires at least 2 data points, got {n}.")
+
+    mid = n // 2
+    med = data[mid] if n % 2 == 1 else (data[mid - 1] + data[mid]) / 2.0
+    q25 = _interpolate_sorted(data, 0.25)
+    q75 = _interpolate_sorted(data, 0.75)
+    lo = data[0]
+    hi = data[-1]
+
+    # One pass for the first two moments. Deviations are taken from the
+    # median, which keeps the shifted sums small and avoids the
+    # cancellation problems of the naive sum-of-squares formula.
+    acc = 0.0
+    acc_sq = 0.0
+    for x in data:
+        d = x - med
+        acc += d
+        acc_sq += d * d
+    var = (acc_sq - acc * acc / n) / (n - 1)
+
     return {
-        "count": float(len(data)),
-        "mean": mean(data),
-        "std": std_dev(data, ddof=1),
-        "min": minimum(data),
-        "q25": quantile(data, 0.25),
-        "median": median(data),
-        "q75": quantile(data, 0.75),
-        "max": maximum(data),
-        "iqr": iqr(data),
-        "range": data_range(data),
+        "count": float(n),
+        "mean": med + acc / n,
+        "std": sqrt(var) if var > 0.0 else 0.0,
+        "min": lo,
+        "q25": q25,
+        "median": med,
+        "q75": q75,
+        "max": hi,
+        "iqr": q75 - q25,
+        "range": hi - lo,
     }
 
 
@@ -302,6 +553,8 @@ __all__ = [
     "variance",
     "std_dev",
     "quantile",
+    "quantiles",
+    "select_kth",
     "iqr",
     "covariance",
     "correlation",
@@ -0,0 +1,289 @@
+"""Mergeable approximate quantile sketch (KLL).
+
+Exact quantiles (:func:`pure_python_stats.quantile`) need all observations
+in memory. The :class:`KLLSketch` defined here instead keeps a bounded
+number of representative samples, arranged in a hierarchy of *compactors*
+following Karnin, Lang & Liberty (2016), "Optimal Quantile Approximation
+in Streams". When a compactor fills up it is sorted and every other item
+(with a random offset) is promoted to the next level with twice the
+weight, so memory stays ``O(k)`` however many values are added.
+
+Accuracy is controlled by ``k``: the normalized rank error of a quantile
+query is roughly ``1.7 / k`` (about 1% for the default ``k=200``).
+Sketches built on separate shards can be combined with
+:meth:`KLLSketch.merge`, and shipped between processes with
+:meth:`KLLSketch.to_bytes` / :meth:`KLLSketch.from_bytes`.
+
+Moments, minimum and maximum are tracked exactly alongside the sketch, so
+:meth:`KLLSketch.summary` returns the same keys as
+:func:`pure_python_stats.summary` with only the quartiles approximated.
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+from array import array
+from itertools import islice
+from math import ceil, nan
+from typing import Dict, Iterable, List, Sequence
+
+from .running_stats import RunningMoments
+
+# Header: magic, format version, k, number of levels, then moments state.
+_HEADER = struct.Struct("<4sBIIqdddd")
+_MAGIC = b"KLLS"
+_VERSION = 1
+_CAPACITY_DECAY = 2.0 / 3.0
+_MIN_CAPACITY = 2
+# Number of values buffered per step of ``update_many``.
+_BATCH = 4096
+
+
+class KLLSketch:
+    """Bounded-memory, mergeable sketch for approximate quantiles.
+
+    Parameters
+    ----------
+    k:
+        Accuracy parameter; the capacity of the top compactor. Larger
+        values give more accurate quantiles at the cost of memory.
+    seed:
+        Optional seed for the random compaction offsets, for reproducible
+        sketches.
+    """
+
+    def __init__(self, k: int = 200, seed: int | None = None) -> None:
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = int(k)
+        self._rng = random.Random(seed)
+        self._compactors: List[List[float]] = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+        self._moments = RunningMoments()
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    def _capacity(self, level: int) -> int:
+        depth = len(self._compactors) - level - 1
+        return max(_MIN_CAPACITY, int(ceil(self.k * _CAPACITY_DECAY**depth)))
+
+    def _grow(self) -> None:
+        self._compactors.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def _compress(self) -> None:
+        while self._size >= self._max_size:
+            for level, items in enumerate(self._compactors):
+                if len(items) >= self._capacity(level):
+                    if level + 1 == len(self._compactors):
+                        self._grow()
+                    items.sort()
+                    keep = items[:1] if len(items) % 2 else []
+                    promoted = items[len(keep) + self._rng.getrandbits(1) :: 2]
+                    self._size -= len(items) - len(keep) - len(promoted)
+                    items[:] = keep
+                    self._compactors[level + 1].extend(promoted)
+                    break
+
+    def update(self, x: float) -> "KLLSketch":
+        """Add a single observation *x*."""
+
+        x = float(x)
+        self._moments.update(x)
+        self._compactors[0].append(x)
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def update_many(self, values: Iterable[float]) -> "KLLSketch":
+        """Add every observation from *values*, consuming it lazily."""
+
+        it = iter(values)
+        while True:
+            batch = [float(x) for x in islice(it, _BATCH)]
+            if not batch:
+                return self
+            self._moments.update_many(batch)
+            self._compactors[0].extend(batch)
+            self._size += len(batch)
+            self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fold *other* into this sketch; both must share the same ``k``."""
+
+        if other.k != self.k:
+            raise ValueError("Cannot merge sketches with different k.")
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for mine, theirs in zip(self._compactors, other._compactors):
+            mine.extend(theirs)
+        self._size = sum(len(items) for items in self._compactors)
+        self._moments.merge(other._moments)
+        self._compress()
+        return self
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @property
+    def count(self) -> int:
+        """Number of observations added (exact)."""
+
+        return self._moments.count
+
+    def _weighted_items(self) -> List[tuple]:
+        items = [
+            (x, 1 << level)
+            for level, compactor in enumerate(self._compactors)
+            for x in compactor
+        ]
+        items.sort()
+        return items
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Return approximate quantiles for every probability in *qs*.
+
+        ``q=0`` and ``q=1`` return the exact minimum and maximum.
+        """
+
+        for q in qs:
+            if not 0.0 <= q <= 1.0:
+                raise ValueError("q must be between 0 and 1 inclusive.")
+        if self.count == 0:
+            raise ValueError("Cannot compute statistic on an empty sequence.")
+
+        items = self._weighted_items()
+        total = sum(w for _, w in items)
+        out = []
+        for q in qs:
+            if q == 0.0:
+                out.append(self._moments.minimum)
+                continue
+            if q == 1.0:
+                out.append(self._moments.maximum)
+                continue
+            target = q * total
+            cum = 0
+            for x, w in items:
+                cum += w
+                if cum >= target:
+                    break
+            out.append(x)
+        return out
+
+    def quantile(self, q: float) -> float:
+        """Return the approximate *q*-quantile of the observations."""
+
+        return self.quantiles([q])[0]
+
+    def rank(self, x: float) -> float:
+        """Return the approximate fraction of observations ``<= x``."""
+
+        if self.count == 0:
+            raise ValueError("Cannot compute statistic on an empty sequence.")
+        weight = 0
+        total = 0
+        for level, compactor in enumerate(self._compactors):
+            w = 1 << level
+            total += w * len(compactor)
+            weight += w * sum(1 for v in compactor if v <= x)
+        return weight / total
+
+    def summary(self) -> Dict[str, float]:
+        """Return the same keys as :func:`pure_python_stats.summary`.
+
+        ``count``, ``mean``, ``std``, ``min``, ``max`` and ``range`` are
+        exact; ``q25``, ``median``, ``q75`` and ``iqr`` are approximate.
+        ``std`` is ``nan`` for a single observation, as in
+        :func:`numpy_stats.np_summary`.
+        """
+
+        q25, q50, q75 = self.quantiles([0.25, 0.5, 0.75])
+        lo = self._moments.minimum
+        hi = self._moments.maximum
+        return {
+            "count": float(self.count),
+            "mean": self._moments.mean,
+            "std": self._moments.std_dev(ddof=1) if self.count > 1 else nan,
+            "min": lo,
+            "q25": q25,
+            "median": q50,
+            "q75": q75,
+            "max": hi,
+            "iqr": q75 - q25,
+            "range": hi - lo,
+        }
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch to a compact little-endian binary blob."""
+
+        levels = len(self._compactors)
+        parts = [
+            _HEADER.pack(_MAGIC, _VERSION, self.k, levels, *self._moments.state()),
+            struct.pack(f"<{levels}I", *(len(c) for c in self._compactors)),
+        ]
+        for compactor in self._compactors:
+            parts.append(array("d", compactor).tobytes())
+        return b"".join(parts)
+
+    def rng_state(self) -> bytes:
+        """Return the state of the random compaction offsets.
+
+        :meth:`to_bytes` does not include it. Restoring it with
+        :meth:`set_rng_state` on the deserialized sketch makes later
+        compactions identical to those of this sketch, e.g. when resuming
+        a checkpointed stream.
+        """
+
+        version, words, _ = self._rng.getstate()
+        return struct.pack(f"<{len(words) + 1}I", version, *words)
+
+    def set_rng_state(self, state: bytes) -> "KLLSketch":
+        """Restore a compaction RNG state returned by :meth:`rng_state`."""
+
+        if len(state) % 4 or len(state) < 8:
+            raise ValueError("Data is not a KLLSketch RNG state.")
+        version, *words = struct.unpack(f"<{len(state) // 4}I", state)
+        self._rng.setstate((version, tuple(words), None))
+        return self
+
+    @classmethod
+    def from_bytes(cls, data: bytes, seed: int | None = None) -> "KLLSketch":
+        """Rebuild a sketch produced by :meth:`to_bytes`."""
+
+        magic, version, k, levels, *state = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Data is not a serialized KLLSketch.")
+        offset = _HEADER.size
+        lengths = struct.unpack_from(f"<{levels}I", data, offset)
+        offset += 4 * levels
+
+        sketch = cls(k=k, seed=seed)
+        sketch._compactors = []
+        for n in lengths:
+            values = array("d")
+            values.frombytes(data[offset : offset + 8 * n])
+            sketch._compactors.append(values.tolist())
+            offset += 8 * n
+        sketch._size = sum(lengths)
+        sketch._max_size = sum(sketch._capacity(h) for h in range(levels))
+        sketch._moments = RunningMoments.from_state(tuple(state))
+        return sketch
+
+    def __repr__(self) -> str:
+        return (
+            f"KLLSketch(k={self.k}, count={self.count}, "
+            f"retained={self._size}, levels={len(self._compactors)})"
+        )
+
+
+__all__ = [
+    "KLLSketch",
+]
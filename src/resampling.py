@@ -0,0 +1,296 @@
+"""Bootstrap confidence intervals and permutation tests.
+
+Resampling a dataset by hand (a closure around ``random.choices`` passed to
+:func:`simulation.run_statistic_simulation`) costs one Python call per
+resample. The engine here draws whole matrices of resample indices with
+NumPy and evaluates a *vectorized* statistic ``statistic(block, axis=1)``
+on each ``(rows, n)`` block, so every resample is one row.
+
+Resamples are processed in chunks of rows sized to about one million
+values, so memory stays bounded (a few tens of MB) however many resamples
+are requested; only one float per resample is kept.
+
+- :func:`bootstrap` returns percentile or BCa (bias-corrected and
+  accelerated) confidence intervals.
+- :func:`permutation_test` performs a two-sample permutation test.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from .numpy_stats import _to_ndarray
+from .simulation import _chunk_sizes, _default_chunk_size, _reduce_block
+
+# Above this many observations the BCa acceleration is estimated with a
+# grouped (delete-a-group) jackknife instead of the O(n^2) leave-one-out one.
+_JACKKNIFE_MAX = 2000
+
+
+@dataclass
+class BootstrapResult:
+    """Outcome of :func:`bootstrap`.
+
+    Attributes
+    ----------
+    estimate:
+        The statistic evaluated on the original data.
+    ci_lower, ci_upper:
+        Confidence interval bounds.
+    ci_level:
+        Nominal coverage of the interval.
+    method:
+        ``"percentile"`` or ``"bca"``.
+    standard_error:
+        Standard deviation of the bootstrap replicates.
+    values:
+        The bootstrap replicates, one per resample.
+    """
+
+    estimate: float
+    ci_lower: float
+    ci_upper: float
+    ci_level: float
+    method: str
+    standard_error: float
+    values: np.ndarray
+
+
+@dataclass
+class PermutationResult:
+    """Outcome of :func:`permutation_test`.
+
+    Attributes
+    ----------
+    statistic:
+        The test statistic on the observed grouping.
+    p_value:
+        Monte Carlo p-value, ``(1 + #extreme) / (1 + n_permutations)``.
+    alternative:
+        ``"two-sided"``, ``"greater"`` or ``"less"``.
+    null_distribution:
+        The statistic under each random relabelling.
+    """
+
+    statistic: float
+    p_value: float
+    alternative: str
+    null_distribution: np.ndarray
+
+
+def _difference_of_means(x: np.ndarray, y: np.ndarray, axis: int) -> np.ndarray:
+    return x.mean(axis=axis) - y.mean(axis=axis)
+
+
+def _statistic_on(statistic: Callable[..., Any], data: np.ndarray) -> float:
+    """Evaluate a block statistic on a single dataset."""
+
+    return float(_reduce_block(statistic, data[np.newaxis, :])[0])
+
+
+def _jackknife_values(statistic: Callable[..., Any], data: np.ndarray) -> np.ndarray:
+    """Leave-one-out (or, for large *data*, leave-one-group-out) estimates."""
+
+    n = data.size
+    if n <= _JACKKNIFE_MAX:
+        out = np.empty(n, dtype=float)
+        cols = np.arange(n - 1)
+        start = 0
+        for rows in _chunk_sizes(n, _default_chunk_size(n - 1)):
+            left_out = np.arange(start, start + rows)[:, np.newaxis]
+            # Row i lists every index except i.
+            block = data[cols + (cols >= left_out)]
+            out[start : start + rows] = _reduce_block(statistic, block)
+            start += rows
+        return out
+
+    groups = np.array_split(np.arange(n), _JACKKNIFE_MAX)
+    keep = np.ones(n, dtype=bool)
+    out = np.empty(len(groups), dtype=float)
+    for g, members in enumerate(groups):
+        keep[members] = False
+        out[g] = _statistic_on(statistic, data[keep])
+        keep[members] = True
+    return out
+
+
+def _bca_levels(
+    values: np.ndarray, estimate: float, jackknife: np.ndarray, alpha: float
+) -> tuple:
+    """Adjusted percentile levels of the BCa interval (Efron, 1987)."""
+
+    normal = NormalDist()
+    below = np.count_nonzero(values < estimate) + 0.5 * np.count_nonzero(values == estimate)
+    prop = min(max(below / values.size, 1.0 / values.size), 1.0 - 1.0 / values.size)
+    z0 = normal.inv_cdf(prop)
+
+    dev = jackknife.mean() - jackknife
+    denom = 6.0 * float(np.sum(dev**2)) ** 1.5
+    accel = float(np.sum(dev**3)) / denom if denom > 0.0 else 0.0
+
+    levels = []
+    for z_alpha in (normal.inv_cdf(alpha), normal.inv_cdf(1.0 - alpha)):
+        shifted = z0 + z_alpha
+        levels.append(normal.cdf(z0 + shifted / (1.0 - accel * shifted)))
+    return tuple(levels)
+
+
+def bootstrap(
+    data: Iterable[float],
+    statistic: Callable[..., Any] = np.mean,
+    n_resamples: int = 10_000,
+    ci_level: float = 0.95,
+    method: str = "percentile",
+    seed: int | np.random.Generator | None = None,
+    chunk_size: int | None = None,
+) -> BootstrapResult:
+    """Bootstrap a statistic and return a confidence interval.
+
+    Parameters
+    ----------
+    data:
+        One-dimensional dataset (anything accepted by
+        :func:`numpy_stats._to_ndarray`, e.g. a column array).
+    statistic:
+        Vectorized statistic ``statistic(block, axis=1)`` returning one
+        value per row; NumPy reductions such as ``np.mean`` or
+        ``np.median`` work directly.
+    n_resamples:
+        Number of bootstrap resamples.
+    ci_level:
+        Nominal coverage of the interval, in (0, 1).
+    method:
+        ``"percentile"`` or ``"bca"``. BCa corrects for bias and skewness;
+        its acceleration uses a jackknife, grouped into 2000 groups for
+        larger datasets.
+    seed:
+        Seed or ``numpy.random.Generator``.
+    chunk_size:
+        Resamples per block; defaults to about one million values.
+    """
+
+    arr = np.ascontiguousarray(_to_ndarray(data), dtype=float).ravel()
+    if arr.size < 2:
+        raise ValueError("bootstrap requires at least 2 observations.")
+    if n_resamples < 2:
+        raise ValueError("n_resamples must be at least 2.")
+    if not 0.0 < ci_level < 1.0:
+        raise ValueError("ci_level must be between 0 and 1 exclusive.")
+    if method not in ("percentile", "bca"):
+        raise ValueError("method must be 'percentile' or 'bca'.")
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+
+    rng = np.random.default_rng(seed)
+    n = arr.size
+    values = np.empty(n_resamples, dtype=float)
+    start = 0
+    for rows in _chunk_sizes(n_resamples, chunk_size or _default_chunk_size(n)):
+        idx = rng.integers(0, n, size=(rows, n))
+        values[start : start + rows] = _reduce_block(statistic, arr[idx])
+        start += rows
+
+    estimate = _statistic_on(statistic, arr)
+    alpha = (1.0 - ci_level) / 2.0
+    if method == "bca":
+        levels = _bca_levels(values, estimate, _jackknife_values(statistic, arr), alpha)
+    else:
+        levels = (alpha, 1.0 - alpha)
+    lower, upper = np.quantile(values, levels)
+
+    return BootstrapResult(
+        estimate=estimate,
+        ci_lower=float(lower),
+        ci_upper=float(upper),
+        ci_level=ci_level,
+        method=method,
+        standard_error=float(values.std(ddof=1)),
+        values=values,
+    )
+
+
+def permutation_test(
+    x: Iterable[float],
+    y: Iterable[float],
+    statistic: Callable[..., Any] = _difference_of_means,
+    n_permutations: int = 10_000,
+    alternative: str = "two-sided",
+    seed: int | np.random.Generator | None = None,
+    chunk_size: int | None = None,
+) -> PermutationResult:
+    """Two-sample permutation test.
+
+    The pooled observations are randomly relabelled into groups of the
+    original sizes, and the statistic is recomputed for every relabelling.
+
+    Parameters
+    ----------
+    x, y:
+        The two samples.
+    statistic:
+        Vectorized two-sample statistic ``statistic(x_block, y_block,
+        axis=1)``; defaults to the difference of means.
+    n_permutations:
+        Number of random relabellings.
+    alternative:
+        ``"two-sided"`` (compare absolute values), ``"greater"`` or
+        ``"less"``.
+    seed, chunk_size:
+        As for :func:`bootstrap`.
+    """
+
+    x_arr = np.ascontiguousarray(_to_ndarray(x), dtype=float).ravel()
+    y_arr = np.ascontiguousarray(_to_ndarray(y), dtype=float).ravel()
+    if n_permutations < 1:
+        raise ValueError("n_permutations must be positive.")
+    if alternative not in ("two-sided", "greater", "less"):
+        raise ValueError("alternative must be 'two-sided', 'greater' or 'less'.")
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+
+    rng = np.random.default_rng(seed)
+    pooled = np.concatenate([x_arr, y_arr])
+    n_x = x_arr.size
+
+    def evaluate(block: np.ndarray) -> np.ndarray:
+        stats = np.array(statistic(block[:, :n_x], block[:, n_x:], axis=1), dtype=float)
+        if stats.shape != (block.shape[0],):
+            raise ValueError(
+                f"statistic returned shape {stats.shape} for a block of "
+                f"{block.shape[0]} permutations, expected {(block.shape[0],)}."
+            )
+        return stats
+
+    observed = float(evaluate(pooled[np.newaxis, :])[0])
+    null = np.empty(n_permutations, dtype=float)
+    start = 0
+    for rows in _chunk_sizes(n_permutations, chunk_size or _default_chunk_size(pooled.size)):
+        block = rng.permuted(np.broadcast_to(pooled, (rows, pooled.size)), axis=1)
+        null[start : start + rows] = evaluate(block)
+        start += rows
+
+    if alternative == "greater":
+        extreme = np.count_nonzero(null >= observed)
+    elif alternative == "less":
+        extreme = np.count_nonzero(null <= observed)
+    else:
+        extreme = np.count_nonzero(np.abs(null) >= abs(observed))
+
+    return PermutationResult(
+        statistic=observed,
+        p_value=(1.0 + extreme) / (1.0 + n_permutations),
+        alternative=alternative,
+        null_distribution=null,
+    )
+
+
+__all__ = [
+    "BootstrapResult",
+    "PermutationResult",
+    "bootstrap",
+    "permutation_test",
+]
@@ -0,0 +1,316 @@
+"""Content-addressed on-disk cache of simulation results.
+
+Re-running a notebook cell with the same generator, statistic, seed and
+sizes repeats an identical simulation. :class:`ResultCache` stores the
+result of :func:`simulation.run_parallel_simulation` under a key derived
+from a stable hash of that specification, so a repeated call returns the
+stored result immediately instead of simulating again.
+
+Each entry is two files in the cache directory: ``<key>.npy`` with the
+statistic values (loaded memory-mapped on a hit) and ``<key>.json`` with
+the remaining fields of the :class:`simulation.SimulationResult`. When the
+directory grows beyond ``max_bytes``, the least recently used entries are
+evicted.
+
+Only seeded runs are cacheable. Python functions are identified by their
+module, qualified name, bytecode (including nested functions), default
+arguments and closure values; callable instances additionally by their
+attributes, and :func:`functools.partial` objects by their bound
+arguments. Values read from globals are not part of the key; pass those
+as ``generator_params`` so that changing them changes the key. Objects
+without a stable description (e.g. a captured
+:class:`numpy.random.Generator`) are rejected with a :class:`ValueError`.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import types
+from typing import Any, Callable, Dict, Mapping
+
+import numpy as np
+
+from .simulation import GeneratorFactory, SimulationResult, run_parallel_simulation
+
+# Options of run_parallel_simulation that do not change the result.
+_UNKEYED_OPTIONS = ("max_workers", "executor")
+
+
+def _jsonable(obj: Any) -> Any:
+    """``json.dumps`` fallback for NumPy values and other objects."""
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.random.SeedSequence):
+        return {"entropy": obj.entropy, "spawn_key": list(obj.spawn_key)}
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    if callable(obj):
+        return _callable_identity(obj)
+    if type(obj).__repr__ is object.__repr__ and _instance_state(obj) is not None:
+        return {"object": _qualified_name(type(obj)), "state": _instance_state(obj)}
+    text = repr(obj)
+    if " at 0x" in text:
+        raise ValueError(f"Cannot derive a stable cache key from {text}.")
+    return text
+
+
+def _qualified_name(obj: Any) -> str:
+    return f"{getattr(obj, '__module__', None)}.{getattr(obj, '__qualname__', None)}"
+
+
+def _instance_state(obj: Any) -> Dict[str, Any] | None:
+    """Attributes of *obj* (``__dict__`` and ``__slots__``), or ``None``."""
+
+    state: Dict[str, Any] = dict(getattr(obj, "__dict__", {}))
+    has_slots = False
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            has_slots = True
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                state[name] = getattr(obj, name)
+    if not state and not has_slots and not hasattr(obj, "__dict__"):
+        return None
+    return state
+
+
+def _hash_code(code: types.CodeType, digest: Any) -> None:
+    """Feed the bytecode, names and constants of *code* into *digest*.
+
+    Nested code objects (inner lambdas and functions) are walked
+    recursively; their ``repr`` contains a memory address.
+    """
+
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        _hash_const(const, digest)
+
+
+def _hash_const(const: Any, digest: Any) -> None:
+    if isinstance(const, types.CodeType):
+        digest.update(b"code(")
+        _hash_code(const, digest)
+        digest.update(b")")
+    elif isinstance(const, (tuple, frozenset)):
+        items = sorted(const, key=repr) if isinstance(const, frozenset) else const
+        digest.update(b"(" if isinstance(const, tuple) else b"{")
+        for item in items:
+            _hash_const(item, digest)
+            digest.update(b",")
+        digest.update(b")" if isinstance(const, tuple) else b"}")
+    else:
+        digest.update(repr(const).encode())
+        digest.update(b";")
+
+
+def _function_identity(func: types.FunctionType) -> Dict[str, Any]:
+    digest = hashlib.sha256()
+    _hash_code(func.__code__, digest)
+    closure = []
+    for cell in func.__closure__ or ():
+        try:
+            closure.append(cell.cell_contents)
+        except ValueError:  # empty cell
+            closure.append(None)
+    return {
+        "callable": _qualified_name(func),
+        "code": digest.hexdigest(),
+        "defaults": list(func.__defaults__ or ()),
+        "kwdefaults": dict(func.__kwdefaults__ or {}),
+        "closure": closure,
+    }
+
+
+def _callable_identity(func: Callable[..., Any]) -> Dict[str, Any]:
+    """A description of *func* that is stable across interpreter sessions."""
+
+    if isinstance(func, functools.partial):
+        return {
+            "partial": _callable_identity(func.func),
+            "args": list(func.args),
+            "keywords": dict(func.keywords),
+        }
+    if isinstance(func, types.FunctionType):
+        return _function_identity(func)
+    if isinstance(func, types.MethodType):
+        return {"method": _callable_identity(func.__func__), "self": func.__self__}
+    call = getattr(type(func), "__call__", None)
+    if not isinstance(func, type) and isinstance(call, types.FunctionType):
+        # Instance of a Python class with __call__: key by code and state.
+        state = _instance_state(func)
+        if state is None:
+            raise ValueError(f"Cannot derive a stable cache key from {func!r}.")
+        return {"call": _function_identity(call), "state": state}
+    # Classes and built-in or compiled callables (NumPy functions, ufuncs).
+    return {"callable": _qualified_name(func)}
+
+
+def spec_key(spec: Mapping[str, Any]) -> str:
+    """Stable hexadecimal SHA-256 key of a simulation specification.
+
+    *spec* is serialized as canonical JSON (sorted keys); callables are
+    replaced by their identity (see the module docstring).
+    """
+
+    text = json.dumps(spec, sort_keys=True, default=_jsonable, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResultCache:
+    """Directory of cached :class:`simulation.SimulationResult` objects.
+
+    Parameters
+    ----------
+    directory:
+        Cache directory; created if it does not exist.
+    max_bytes:
+        Size limit of the directory. After every store, least recently
+        used entries are removed until the total size is below the limit.
+
+    Attributes
+    ----------
+    hits, misses:
+        Number of lookups served from and missing in the cache.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = 1 << 30) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive.")
+        self.directory = os.fspath(directory)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _paths(self, key: str) -> tuple:
+        base = os.path.join(self.directory, key)
+        return f"{base}.npy", f"{base}.json"
+
+    def get(self, key: str) -> SimulationResult | None:
+        """Return the result stored under *key*, or ``None``."""
+
+        values_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as fh:
+                fields = json.load(fh)
+            values = np.load(values_path, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        # The metadata file's modification time doubles as the LRU clock.
+        os.utime(meta_path)
+        self.hits += 1
+        return SimulationResult(values=values, **fields)
+
+    def put(self, key: str, result: SimulationResult) -> None:
+        """Store *result* under *key* and evict entries beyond the limit."""
+
+        values_path, meta_path = self._paths(key)
+        fields = {
+            "statistic_name": result.statistic_name,
+            "sample_size": result.sample_size,
+            "n_simulations": result.n_simulations,
+            "summary": result.summary,
+            "metadata": result.metadata,
+        }
+        # Values first, metadata last: an entry only counts once its
+        # metadata file exists.
+        with open(f"{values_path}.tmp", "wb") as fh:
+            np.save(fh, np.asarray(result.values, dtype=float))
+        os.replace(f"{values_path}.tmp", values_path)
+        with open(f"{meta_path}.tmp", "w", encoding="utf-8") as fh:
+            json.dump(fields, fh, default=_jsonable)
+        os.replace(f"{meta_path}.tmp", meta_path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            values_path, meta_path = self._paths(name[: -len(".json")])
+            try:
+                size = os.path.getsize(meta_path) + os.path.getsize(values_path)
+                entries.append((os.path.getmtime(meta_path), size, values_path, meta_path))
+            except OSError:
+                continue
+            total += size
+
+        for _, size, values_path, meta_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in (meta_path, values_path):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+
+        for name in os.listdir(self.directory):
+            if name.endswith((".npy", ".json")):
+                os.remove(os.path.join(self.directory, name))
+
+    def run(
+        self,
+        generator_factory: GeneratorFactory,
+        statistic: Callable[..., Any],
+        sample_size: int,
+        n_simulations: int,
+        seed: int | np.random.SeedSequence,
+        generator_params: Mapping[str, Any] | None = None,
+        **options: Any,
+    ) -> SimulationResult:
+        """Cached :func:`simulation.run_parallel_simulation`.
+
+        Parameters
+        ----------
+        generator_factory, statistic, sample_size, n_simulations, seed:
+            As for :func:`simulation.run_parallel_simulation`; *seed* is
+            required.
+        generator_params:
+            Parameters of the data-generating process that are not visible
+            in *generator_factory* itself (closure or global values). They
+            only enter the cache key.
+        **options:
+            Further keyword arguments of
+            :func:`simulation.run_parallel_simulation`. All except
+            ``max_workers`` and ``executor`` are part of the key.
+        """
+
+        if seed is None:
+            raise ValueError("A seed is required to cache a simulation.")
+        spec = {
+            "generator": generator_factory,
+            "generator_params": dict(generator_params or {}),
+            "statistic": statistic,
+            "sample_size": sample_size,
+            "n_simulations": n_simulations,
+            "seed": seed,
+            "options": {k: v for k, v in options.items() if k not in _UNKEYED_OPTIONS},
+        }
+        key = spec_key(spec)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        result = run_parallel_simulation(
+            generator_factory, statistic, sample_size, n_simulations, seed=seed, **options
+        )
+        self.put(key, result)
+        return result
+
+
+__all__ = [
+    "ResultCache",
+    "spec_key",
+]
@@ -0,0 +1,269 @@
+"""Mergeable streaming accumulators for moments and covariance.
+
+The functions in :mod:`pure_python_stats` materialize their input as a
+list, which is convenient but requires the whole dataset to fit in memory.
+The accumulators in this module instead consume values one at a time and
+keep only a handful of running totals, so they can summarize unbounded
+streams in constant memory.
+
+Two accumulators built on different workers (or different chunks of a
+file) can be combined with :meth:`RunningMoments.merge` /
+:meth:`RunningCovariance.merge`, using the pairwise update formulas of
+Chan, Golub & LeVeque (1979). Single-value updates use Welford's method.
+
+Example::
+
+    acc = RunningMoments()
+    for chunk in chunks:
+        acc.update_many(chunk)
+    acc.mean, acc.variance(ddof=1)
+
+Results agree with the list-based functions in :mod:`pure_python_stats`
+up to floating-point rounding.
+"""
+
+from __future__ import annotations
+
+from itertools import zip_longest
+from math import sqrt
+from typing import Iterable, Tuple
+
+
+class RunningMoments:
+    """Streaming accumulator for count, mean, variance, min and max.
+
+    Attributes
+    ----------
+    count:
+        Number of values seen so far.
+    minimum, maximum:
+        Smallest and largest values seen so far (``nan`` while empty).
+    """
+
+    __slots__ = ("count", "_mean", "_m2", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.minimum = float("nan")
+        self.maximum = float("nan")
+
+    def update(self, x: float) -> "RunningMoments":
+        """Add a single observation *x* (Welford's update)."""
+
+        x = float(x)
+        self.count += 1
+        if self.count == 1:
+            self.minimum = x
+            self.maximum = x
+        elif x < self.minimum:
+            self.minimum = x
+        elif x > self.maximum:
+            self.maximum = x
+        delta = x - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (x - self._mean)
+        return self
+
+    def update_many(self, values: Iterable[float]) -> "RunningMoments":
+        """Add every observation from *values*, consuming it lazily."""
+
+        n = self.count
+        m = self._mean
+        m2 = self._m2
+        lo = self.minimum
+        hi = self.maximum
+        for x in values:
+            x = float(x)
+            n += 1
+            if n == 1:
+                lo = hi = x
+            elif x < lo:
+                lo = x
+            elif x > hi:
+                hi = x
+            delta = x - m
+            m += delta / n
+            m2 += delta * (x - m)
+        self.count = n
+        self._mean = m
+        self._m2 = m2
+        self.minimum = lo
+        self.maximum = hi
+        return self
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """Fold the state of *other* into this accumulator (Chan et al.)."""
+
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count = other.count
+            self._mean = other._mean
+            self._m2 = other._m2
+            self.minimum = other.minimum
+            self.maximum = other.maximum
+            return self
+
+        n = self.count + other.count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / n
+        self._mean += delta * other.count / n
+        self.count = n
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def copy(self) -> "RunningMoments":
+        """Return an independent copy of this accumulator."""
+
+        return RunningMoments().merge(self)
+
+    def state(self) -> Tuple[int, float, float, float, float]:
+        """Return the raw accumulator state ``(count, mean, m2, min, max)``.
+
+        Intended for serialization; see :meth:`from_state`.
+        """
+
+        return (self.count, self._mean, self._m2, self.minimum, self.maximum)
+
+    @classmethod
+    def from_state(cls, state: Tuple[int, float, float, float, float]) -> "RunningMoments":
+        """Rebuild an accumulator from the output of :meth:`state`."""
+
+        acc = cls()
+        count, acc._mean, acc._m2, acc.minimum, acc.maximum = state
+        acc.count = int(count)
+        return acc
+
+    @property
+    def mean(self) -> float:
+        """Arithmetic mean of the values seen so far."""
+
+        if self.count == 0:
+            raise ValueError("Cannot compute statistic on an empty sequence.")
+        return self._mean
+
+    def variance(self, ddof: int = 1) -> float:
+        """Return the variance; see :func:`pure_python_stats.variance`."""
+
+        if self.count <= ddof:
+            raise ValueError(
+                f"variance requires at least {ddof + 1} data points, got {self.count}."
+            )
+        return self._m2 / (self.count - ddof)
+
+    def std_dev(self, ddof: int = 1) -> float:
+        """Return the standard deviation (square root of :meth:`variance`)."""
+
+        return sqrt(self.variance(ddof=ddof))
+
+    def __repr__(self) -> str:
+        return f"RunningMoments(count={self.count}, mean={self._mean!r}, m2={self._m2!r})"
+
+
+class RunningCovariance:
+    """Streaming accumulator for the covariance and correlation of pairs."""
+
+    __slots__ = ("count", "_mean_x", "_mean_y", "_m2_x", "_m2_y", "_c_xy")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._m2_x = 0.0
+        self._m2_y = 0.0
+        self._c_xy = 0.0
+
+    def update(self, x: float, y: float) -> "RunningCovariance":
+        """Add a single paired observation ``(x, y)``."""
+
+        x = float(x)
+        y = float(y)
+        self.count += 1
+        dx = x - self._mean_x
+        self._mean_x += dx / self.count
+        dy = y - self._mean_y
+        self._mean_y += dy / self.count
+        self._m2_x += dx * (x - self._mean_x)
+        self._m2_y += dy * (y - self._mean_y)
+        self._c_xy += dx * (y - self._mean_y)
+        return self
+
+    def update_many(self, x: Iterable[float], y: Iterable[float]) -> "RunningCovariance":
+        """Add paired observations from *x* and *y*, consuming both lazily.
+
+        Raises
+        ------
+        ValueError
+            If *x* and *y* yield a different number of elements. Pairs
+            consumed before the mismatch was detected remain applied.
+        """
+
+        missing = object()
+        for xi, yi in zip_longest(x, y, fillvalue=missing):
+            if xi is missing or yi is missing:
+                raise ValueError("x and y must contain the same number of elements.")
+            self.update(xi, yi)
+        return self
+
+    def merge(self, other: "RunningCovariance") -> "RunningCovariance":
+        """Fold the state of *other* into this accumulator (Chan et al.)."""
+
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count = other.count
+            self._mean_x = other._mean_x
+            self._mean_y = other._mean_y
+            self._m2_x = other._m2_x
+            self._m2_y = other._m2_y
+            self._c_xy = other._c_xy
+            return self
+
+        n = self.count + other.count
+        weight = self.count * other.count / n
+        dx = other._mean_x - self._mean_x
+        dy = other._mean_y - self._mean_y
+        self._m2_x += other._m2_x + dx * dx * weight
+        self._m2_y += other._m2_y + dy * dy * weight
+        self._c_xy += other._c_xy + dx * dy * weight
+        self._mean_x += dx * other.count / n
+        self._mean_y += dy * other.count / n
+        self.count = n
+        return self
+
+    def copy(self) -> "RunningCovariance":
+        """Return an independent copy of this accumulator."""
+
+        return RunningCovariance().merge(self)
+
+    def covariance(self, ddof: int = 1) -> float:
+        """Return the covariance; see :func:`pure_python_stats.covariance`."""
+
+        if self.count <= ddof:
+            raise ValueError(
+                f"covariance requires at least {ddof + 1} paired values, got {self.count}."
+            )
+        return self._c_xy / (self.count - ddof)
+
+    def correlation(self) -> float:
+        """Return the Pearson correlation coefficient of the pairs seen."""
+
+        if self.count <= 1:
+            raise ValueError(
+                f"covariance requires at least 2 paired values, got {self.count}."
+            )
+        if self._m2_x == 0 or self._m2_y == 0:
+            raise ValueError("Correlation is undefined when one series has zero variance.")
+        return self._c_xy / sqrt(self._m2_x * self._m2_y)
+
+    def __repr__(self) -> str:
+        return f"RunningCovariance(count={self.count}, c_xy={self._c_xy!r})"
+
+
+__all__ = [
+    "RunningMoments",
+    "RunningCovariance",
+]
@@ -10,28 +10,119 @@ sampling pattern that often appears in introductory statistics:
 This module is distribution-agnostic: callers supply a *sample generator*
 function and a *statistic* function. This keeps the API flexible and easy
 to integrate with arbitrary data-generating processes.
+
+Two execution modes are available:
+
+- the default *scalar* mode calls ``sample_generator(n)`` and
+  ``statistic(sample)`` once per replicate;
+- the *vectorized* mode (``vectorized=True``) asks the generator for whole
+  ``(rows, n)`` blocks of samples and lets the statistic reduce each block
+  along ``axis=1``, so the per-replicate Python overhead disappears. NumPy
+  functions such as ``np.mean`` or ``np.median`` can be used as
+  statistics directly, and a generator such as
+  ``lambda size: rng.normal(0, 1, size=size)`` works in both modes.
+  Generators from :mod:`distributions` additionally fill one reusable
+  buffer instead of allocating a new sample for every call.
+
+:func:`run_parallel_simulation` distributes chunks of replicates over a
+process pool. Instead of a ready-made generator it takes a *generator
+factory* ``factory(rng) -> sample_generator`` so that every chunk can be
+given its own independent ``numpy.random.Generator`` spawned from a single
+:class:`numpy.random.SeedSequence`; results are therefore reproducible and
+independent of the number of workers.
+
+For runs too large to keep every replicate, ``streaming=True`` feeds the
+statistic values into a :class:`quantile_sketch.KLLSketch` (exact moments,
+approximate quartiles) chunk by chunk instead of collecting them in a
+list; raw values can optionally be spilled to a memory-mapped ``.npy``
+file. Memory use is then independent of ``n_simulations``.
+
+Setting ``target_se`` and/or ``time_budget`` turns ``n_simulations`` into
+an upper bound: replicates are produced chunk by chunk and the run stops
+as soon as the Monte Carlo standard errors of the tracked summary fields
+fall below the target, or the time budget is spent. The reason for
+stopping is recorded in ``metadata["stopping"]``.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Iterable, List, Dict, Any
+import json
+import math
+import os
+import struct
+import time
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Mapping, Sequence, Tuple
 
-from .pure_python_stats import summary as summary_fn
+import numpy as np
+
+from .numpy_stats import np_summary
+from .quantile_sketch import KLLSketch
+from .running_stats import RunningMoments
 
 
 StatisticFunc = Callable[[Iterable[float]], float]
 SampleGenerator = Callable[[int], Iterable[float]]
+BlockSampleGenerator = Callable[[Tuple[int, int]], np.ndarray]
+BlockStatisticFunc = Callable[..., np.ndarray]
+GeneratorFactory = Callable[[np.random.Generator], Callable[..., Any]]
+
+# Target number of sample values drawn per block in vectorized mode
+# (8 MiB of float64), which bounds peak memory independently of
+# ``n_simulations``.
+_DEFAULT_BLOCK_ELEMENTS = 1 << 20
+
+# Default number of tasks ``run_parallel_simulation`` splits a run into.
+_DEFAULT_PARALLEL_TASKS = 64
+
+# Replicates per chunk when the scalar mode streams its values.
+_STREAM_CHUNK = 4096
+
+
+def _json_default(obj: Any) -> Any:
+    """``json.dumps`` fallback used when saving result metadata."""
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return repr(obj)
+
+
+def _npz_member_memmap(path: str, name: str, mode: str) -> np.memmap:
+    """Memory-map the array *name* stored uncompressed inside an ``.npz``."""
+
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"{path} is compressed and cannot be memory-mapped.")
+    with open(path, "rb") as fh:
+        # Skip the zip local file header: 30 fixed bytes, then the file
+        # name and extra field whose lengths end the fixed part.
+        fh.seek(info.header_offset + 26)
+        name_len, extra_len = struct.unpack("<HH", fh.read(4))
+        fh.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(fh)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(fh)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(fh)
+        offset = fh.tell()
+    return np.memmap(
+        path, dtype=dtype, mode=mode, offset=offset, shape=shape, order="F" if fortran else "C"
+    )
 
 
-@dataclass
 class SimulationResult:
     """Container for the results of a simulation run.
 
     Attributes
     ----------
     values:
-        List of simulated statistic values, one per simulation.
+        Simulated statistic values as a float64 array, one per
+        simulation. In streaming mode this is a memory-mapped array when
+        values were spilled to disk, and an empty array otherwise.
     statistic_name:
         A human-readable name for the statistic (e.g., "mean").
     sample_size:
@@ -40,17 +131,398 @@ class SimulationResult:
         Number of repeated simulations.
     summary:
         A dictionary with descriptive statistics of ``values`` as
-        computed by :func:`pure_python_stats.summary`.
+        computed by :func:`numpy_stats.np_summary`. Unless given to the
+        constructor, it is computed on first access.
     metadata:
         Optional free-form metadata (e.g., distribution parameters).
+    sketch:
+        In streaming mode, the quantile sketch the summary was computed
+        from; it can answer further approximate quantile queries.
+    """
+
+    __slots__ = (
+        "values",
+        "statistic_name",
+        "sample_size",
+        "n_simulations",
+        "metadata",
+        "sketch",
+        "_summary",
+    )
+
+    def __init__(
+        self,
+        values: Sequence[float] | np.ndarray,
+        statistic_name: str,
+        sample_size: int,
+        n_simulations: int,
+        summary: Dict[str, float] | None = None,
+        metadata: Dict[str, Any] | None = None,
+        sketch: KLLSketch | None = None,
+    ) -> None:
+        if isinstance(values, np.ndarray) and values.dtype == np.float64:
+            # Keep float64 arrays and memory maps as they are, without a copy.
+            self.values = values
+        else:
+            self.values = np.asarray(values, dtype=float)
+        self.statistic_name = statistic_name
+        self.sample_size = sample_size
+        self.n_simulations = n_simulations
+        self.metadata = metadata
+        self.sketch = sketch
+        self._summary = summary
+
+    @property
+    def summary(self) -> Dict[str, float]:
+        if self._summary is None:
+            self._summary = np_summary(self.values)
+        return self._summary
+
+    @summary.setter
+    def summary(self, value: Dict[str, float]) -> None:
+        self._summary = value
+
+    def __repr__(self) -> str:
+        return (
+            f"SimulationResult(statistic_name={self.statistic_name!r}, "
+            f"sample_size={self.sample_size}, n_simulations={self.n_simulations})"
+        )
+
+    def to_npz(self, path: str | os.PathLike) -> None:
+        """Save the result as an uncompressed NumPy ``.npz`` archive.
+
+        The values are stored as raw float64 (so :meth:`from_npz` can
+        memory-map them), the other fields as a JSON header, and a
+        streaming sketch as its :meth:`~quantile_sketch.KLLSketch.to_bytes`
+        blob. A summary is only stored if it has been computed.
+        """
+
+        header = {
+            "statistic_name": self.statistic_name,
+            "sample_size": self.sample_size,
+            "n_simulations": self.n_simulations,
+            "summary": self._summary,
+            "metadata": self.metadata,
+        }
+        arrays = {"header": np.array(json.dumps(header, default=_json_default))}
+        if self.sketch is not None:
+            arrays["sketch"] = np.frombuffer(self.sketch.to_bytes(), dtype=np.uint8)
+        with open(path, "wb") as fh:
+            np.savez(fh, values=self.values, **arrays)
+
+    @classmethod
+    def from_npz(
+        cls, path: str | os.PathLike, mmap_mode: str | None = None
+    ) -> "SimulationResult":
+        """Load a result written by :meth:`to_npz`.
+
+        Parameters
+        ----------
+        path:
+            The ``.npz`` file.
+        mmap_mode:
+            ``None`` reads the values into memory; ``"r"`` (read-only) or
+            ``"c"`` (copy-on-write) memory-maps them straight from the
+            archive instead.
+        """
+
+        if mmap_mode not in (None, "r", "c"):
+            raise ValueError("mmap_mode must be None, 'r' or 'c'.")
+        path = os.fspath(path)
+        with np.load(path, allow_pickle=False) as data:
+            header = json.loads(str(data["header"]))
+            sketch = KLLSketch.from_bytes(data["sketch"].tobytes()) if "sketch" in data else None
+            values = data["values"] if mmap_mode is None else None
+        if values is None:
+            values = _npz_member_memmap(path, "values", mmap_mode)
+        return cls(values=values, sketch=sketch, **header)
+
+
+def _chunk_sizes(total: int, chunk_size: int) -> Iterator[int]:
+    """Yield chunk lengths of at most *chunk_size* that add up to *total*."""
+
+    done = 0
+    while done < total:
+        step = min(chunk_size, total - done)
+        yield step
+        done += step
+
+
+def _default_chunk_size(sample_size: int) -> int:
+    return max(1, _DEFAULT_BLOCK_ELEMENTS // sample_size)
+
+
+def _draw_sample(sample_generator: SampleGenerator, sample_size: int) -> List[float]:
+    """Draw one sample as a list and check its length."""
+
+    sample = sample_generator(sample_size)
+    # Materialize in case the generator is single-use
+    sample_list = list(sample)
+    if len(sample_list) != sample_size:
+        raise ValueError(
+            f"sample_generator returned {len(sample_list)} observations, "
+            f"expected {sample_size}."
+        )
+    return sample_list
+
+
+def _scalar_values(
+    sample_generator: SampleGenerator,
+    statistic: StatisticFunc,
+    sample_size: int,
+    n_simulations: int,
+) -> np.ndarray:
+    """Compute the statistic one replicate at a time."""
+
+    values = np.empty(n_simulations, dtype=float)
+    fill = getattr(sample_generator, "fill", None)
+    if fill is not None:
+        # Buffer-filling generators (see :mod:`distributions`) reuse one
+        # sample array for every replicate.
+        buffer = np.empty(sample_size, dtype=float)
+        for i in range(n_simulations):
+            values[i] = float(statistic(fill(buffer)))
+        return values
+
+    for i in range(n_simulations):
+        values[i] = float(statistic(_draw_sample(sample_generator, sample_size)))
+    return values
+
+
+def _block_buffer(
+    sample_generator: Callable[..., Any], sample_size: int, rows: int
+) -> np.ndarray | None:
+    """Allocate a reusable block buffer if the generator can fill one."""
+
+    if hasattr(sample_generator, "fill"):
+        return np.empty((rows, sample_size), dtype=float)
+    return None
+
+
+def _draw_block(
+    sample_generator: BlockSampleGenerator,
+    sample_size: int,
+    rows: int,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Draw one ``(rows, sample_size)`` block of samples and check its shape.
+
+    When *out* is given (see :func:`_block_buffer`), the block is written
+    into its leading rows through ``sample_generator.fill``.
+    """
+
+    if out is not None:
+        block = sample_generator.fill(out[:rows])  # type: ignore[attr-defined]
+    else:
+        block = np.asarray(sample_generator((rows, sample_size)), dtype=float)
+    if block.shape != (rows, sample_size):
+        raise ValueError(
+            f"sample_generator returned a block of shape {block.shape}, "
+            f"expected {(rows, sample_size)}."
+        )
+    return block
+
+
+def _reduce_block(statistic: BlockStatisticFunc, block: np.ndarray) -> np.ndarray:
+    """Apply a block statistic along axis 1 and check the result shape."""
+
+    rows = block.shape[0]
+    # Copy, so a statistic returning a view cannot alias a reused buffer.
+    stats = np.array(statistic(block, axis=1), dtype=float)
+    if stats.shape != (rows,):
+        raise ValueError(
+            f"statistic returned shape {stats.shape} for a block of {rows} "
+            f"samples, expected {(rows,)}."
+        )
+    return stats
+
+
+def _block_values(
+    sample_generator: BlockSampleGenerator,
+    statistic: BlockStatisticFunc,
+    sample_size: int,
+    rows: int,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Draw one ``(rows, sample_size)`` block and reduce it along axis 1."""
+
+    return _reduce_block(statistic, _draw_block(sample_generator, sample_size, rows, out))
+
+
+def _iter_value_chunks(
+    sample_generator: Callable[..., Any],
+    statistic: Callable[..., Any],
+    sample_size: int,
+    n_simulations: int,
+    vectorized: bool,
+    chunk_size: int,
+) -> Iterator[np.ndarray]:
+    """Yield the statistic values chunk by chunk as float arrays."""
+
+    buffer = _block_buffer(sample_generator, sample_size, chunk_size) if vectorized else None
+    for rows in _chunk_sizes(n_simulations, chunk_size):
+        if vectorized:
+            yield _block_values(sample_generator, statistic, sample_size, rows, buffer)
+        else:
+            yield _scalar_values(sample_generator, statistic, sample_size, rows)
+
+
+def _stream_values(
+    chunks: Iterable[np.ndarray],
+    n_simulations: int,
+    spill_path: str | os.PathLike | None,
+    sketch_k: int,
+) -> Tuple[Sequence[float], KLLSketch]:
+    """Feed value chunks into a sketch, optionally spilling them to disk."""
+
+    sketch = KLLSketch(k=sketch_k, seed=0)
+    spill = None
+    if spill_path is not None:
+        spill = np.lib.format.open_memmap(
+            os.fspath(spill_path), mode="w+", dtype=np.float64, shape=(n_simulations,)
+        )
+
+    start = 0
+    for chunk in chunks:
+        sketch.update_many(chunk.tolist())
+        if spill is not None:
+            spill[start : start + chunk.size] = chunk
+        start += chunk.size
+
+    if spill is None:
+        return [], sketch
+    spill.flush()
+    return spill, sketch
+
+
+def _quantile_key(q: float) -> str:
+    """Name of the standard-error entry for quantile *q* (e.g. ``q97.5``)."""
+
+    return f"q{100.0 * q:g}"
+
+
+def _quantile_standard_errors(
+    values: np.ndarray, quantiles: Sequence[float]
+) -> Dict[str, float]:
+    """Estimate Monte Carlo standard errors of quantiles of *values*.
+
+    Uses a density-free order statistic estimate: the rank of the
+    ``q``-quantile has binomial standard deviation ``sqrt(N q (1 - q))``,
+    so half the spread between the order statistics that far below and
+    above it approximates one standard error.
     """
 
-    values: List[float]
-    statistic_name: str
-    sample_size: int
-    n_simulations: int
-    summary: Dict[str, float]
-    metadata: Dict[str, Any] | None = None
+    n = values.size
+    errors = {}
+    for q in quantiles:
+        centre = q * (n - 1)
+        half_width = math.sqrt(n * q * (1.0 - q))
+        lo = max(0, math.floor(centre - half_width))
+        hi = min(n - 1, math.ceil(centre + half_width))
+        part = np.partition(values, [lo, hi])
+        errors[_quantile_key(q)] = float(part[hi] - part[lo]) / 2.0
+    return errors
+
+
+def _chunk_moments(chunk: np.ndarray) -> RunningMoments:
+    """:class:`RunningMoments` of *chunk*, computed with NumPy."""
+
+    mean = float(chunk.mean())
+    deviations = chunk - mean
+    return RunningMoments.from_state(
+        (chunk.size, mean, float(deviations @ deviations), float(chunk.min()), float(chunk.max()))
+    )
+
+
+def _adaptive_values(
+    chunks: Iterable[np.ndarray],
+    n_simulations: int,
+    target_se: float | None,
+    quantiles: Sequence[float],
+    time_budget: float | None,
+    min_simulations: int,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """Consume value chunks until the precision or time target is met.
+
+    The standard error of the mean comes from running moments and is
+    checked after every chunk. Quantile standard errors need a pass over
+    all values, so they are re-checked on a geometric schedule: at the
+    sample size the last estimate predicts is needed, but after at least
+    25% and at most 100% more replicates. The total work stays linear in
+    the number of replicates.
+    """
+
+    started = time.perf_counter()
+    values = np.empty(0, dtype=float)
+    moments = RunningMoments()
+    filled = 0
+    next_quantile_check = 0
+    reason = "n_simulations"
+    for chunk in chunks:
+        if filled + chunk.size > values.size:
+            # Grow geometrically; n_simulations is only an upper bound.
+            capacity = min(n_simulations, max(2 * values.size, filled + chunk.size))
+            grown = np.empty(capacity, dtype=float)
+            grown[:filled] = values[:filled]
+            values = grown
+        values[filled : filled + chunk.size] = chunk
+        filled += chunk.size
+        moments.merge(_chunk_moments(chunk))
+        if filled >= n_simulations:
+            break
+        if time_budget is not None and time.perf_counter() - started >= time_budget:
+            reason = "time_budget"
+            break
+        if target_se is None or filled < max(min_simulations, 2):
+            continue
+        if moments.std_dev(ddof=1) / math.sqrt(filled) > target_se:
+            continue
+        if quantiles:
+            if filled < next_quantile_check:
+                continue
+            worst = max(_quantile_standard_errors(values[:filled], quantiles).values())
+            if worst > target_se:
+                # Standard errors shrink like 1 / sqrt(N).
+                needed = filled * (worst / target_se) ** 2
+                next_quantile_check = int(min(2.0 * filled, max(1.25 * filled, needed)))
+                continue
+        reason = "target_se"
+        break
+
+    values = values[:filled]
+    errors = {}
+    if filled > 1:
+        errors["mean"] = moments.std_dev(ddof=1) / math.sqrt(filled)
+        errors.update(_quantile_standard_errors(values, quantiles))
+    stopping = {
+        "reason": reason,
+        "n_simulations": filled,
+        "max_simulations": n_simulations,
+        "elapsed": time.perf_counter() - started,
+        "target_se": target_se,
+        "time_budget": time_budget,
+        "standard_errors": errors,
+    }
+    return values, stopping
+
+
+def _vectorized_values(
+    sample_generator: BlockSampleGenerator,
+    statistic: BlockStatisticFunc,
+    sample_size: int,
+    n_simulations: int,
+    chunk_size: int,
+) -> np.ndarray:
+    """Compute the statistic for all replicates, one block at a time."""
+
+    values = np.empty(n_simulations, dtype=float)
+    start = 0
+    for chunk in _iter_value_chunks(
+        sample_generator, statistic, sample_size, n_simulations, True, chunk_size
+    ):
+        values[start : start + chunk.size] = chunk
+        start += chunk.size
+    return values
 
 
 def run_statistic_simulation(
@@ -60,6 +532,15 @@ def run_statistic_simulation(
     n_simulations: int,
     statistic_name: str | None = None,
     metadata: Dict[str, Any] | None = None,
+    vectorized: bool = False,
+    chunk_size: int | None = None,
+    streaming: bool = False,
+    spill_path: str | os.PathLike | None = None,
+    sketch_k: int = 200,
+    target_se: float | None = None,
+    precision_quantiles: Sequence[float] = (),
+    time_budget: float | None = None,
+    min_simulations: int = 100,
 ) -> SimulationResult:
     """Run repeated simulations of a statistic on random samples.
 
@@ -68,19 +549,58 @@ def run_statistic_simulation(
     sample_generator:
         A callable ``sample_generator(n) -> Iterable[float]`` that returns
         a collection of *n* observations drawn from some distribution.
+        In vectorized mode it is instead called with a shape tuple
+        ``(rows, n)`` and must return an array of that shape.
     statistic:
         A callable ``statistic(values) -> float`` that computes a scalar
-        summary from an iterable of numbers.
+        summary from an iterable of numbers. In vectorized mode it is
+        called as ``statistic(block, axis=1)`` and must return one value
+        per row of *block*.
     sample_size:
         The size ``n`` of each simulated sample.
     n_simulations:
-        The number of repeated simulations to perform.
+        The number of repeated simulations to perform. In adaptive mode
+        (``target_se`` or ``time_budget`` given) this is an upper bound.
     statistic_name:
         Optional label used for reporting and plotting. If not provided,
         ``statistic.__name__`` is used when available.
     metadata:
         Optional dictionary with extra metadata to be attached to the
         resulting :class:`SimulationResult`.
+    vectorized:
+        If ``True``, draw and reduce samples in ``(rows, n)`` blocks
+        instead of one replicate at a time.
+    chunk_size:
+        Number of replicates per chunk. In vectorized mode this is the
+        block height and defaults to roughly one million sample values per
+        block; in scalar mode it only matters for the streaming and
+        adaptive modes and defaults to 4096.
+    streaming:
+        If ``True``, do not keep the statistic values in memory; summarize
+        them with a :class:`quantile_sketch.KLLSketch` instead. ``count``,
+        ``mean``, ``std``, ``min`` and ``max`` stay exact while the
+        quartiles become approximate.
+    spill_path:
+        In streaming mode, optional path of a ``.npy`` file to which the
+        raw values are written through a memory map; the map is returned
+        as ``SimulationResult.values``.
+    sketch_k:
+        Accuracy parameter of the sketch used in streaming mode.
+    target_se:
+        Adaptive mode: stop once the Monte Carlo standard error of the
+        mean of the statistic, and of every quantile in
+        *precision_quantiles*, is at most this value. The mean is checked
+        after every chunk, quantiles on a geometric schedule (see
+        ``metadata["stopping"]`` for the estimates at stop).
+    precision_quantiles:
+        Quantiles (in [0, 1]) whose standard error must also meet
+        *target_se*, e.g. ``(0.025, 0.975)`` for interval endpoints.
+    time_budget:
+        Adaptive mode: stop after the first chunk that ends more than this
+        many seconds after the start.
+    min_simulations:
+        Adaptive mode: never stop on precision before this many
+        replicates.
 
     Returns
     -------
@@ -93,35 +613,265 @@ def run_statistic_simulation(
         raise ValueError("sample_size must be positive.")
     if n_simulations <= 0:
         raise ValueError("n_simulations must be positive.")
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    if spill_path is not None and not streaming:
+        raise ValueError("spill_path requires streaming=True.")
+    adaptive = target_se is not None or time_budget is not None
+    if adaptive and streaming:
+        raise ValueError("Adaptive stopping cannot be combined with streaming=True.")
+    if target_se is not None and target_se <= 0:
+        raise ValueError("target_se must be positive.")
+    if time_budget is not None and time_budget <= 0:
+        raise ValueError("time_budget must be positive.")
+    for q in precision_quantiles:
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be between 0 and 1 inclusive.")
 
     stat_name = statistic_name or getattr(statistic, "__name__", "statistic")
+    default_chunk = _default_chunk_size(sample_size) if vectorized else _STREAM_CHUNK
+    chunks = _iter_value_chunks(
+        sample_generator,
+        statistic,
+        sample_size,
+        n_simulations,
+        vectorized,
+        chunk_size or default_chunk,
+    )
 
-    values: List[float] = []
-    for _ in range(n_simulations):
-        sample = sample_generator(sample_size)
-        # Materialize in case the generator is single-use
-        sample_list = list(sample)
-        if len(sample_list) != sample_size:
-            raise ValueError(
-                f"sample_generator returned {len(sample_list)} observations, "
-                f"expected {sample_size}."
-            )
-        value = statistic(sample_list)
-        values.append(float(value))
-
-    sim_summary = summary_fn(values)
+    if adaptive:
+        arr, stopping = _adaptive_values(
+            chunks, n_simulations, target_se, precision_quantiles, time_budget, min_simulations
+        )
+        run_metadata = dict(metadata or {})
+        run_metadata["stopping"] = stopping
+        return SimulationResult(
+            values=arr,
+            statistic_name=stat_name,
+            sample_size=sample_size,
+            n_simulations=arr.size,
+            metadata=run_metadata,
+        )
+
+    if streaming:
+        values, sketch = _stream_values(chunks, n_simulations, spill_path, sketch_k)
+        return SimulationResult(
+            values=values,
+            statistic_name=stat_name,
+            sample_size=sample_size,
+            n_simulations=n_simulations,
+            summary=sketch.summary(),
+            metadata=metadata or {},
+            sketch=sketch,
+        )
+
+    if vectorized:
+        values = _vectorized_values(
+            sample_generator,  # type: ignore[arg-type]
+            statistic,
+            sample_size,
+            n_simulations,
+            chunk_size or _default_chunk_size(sample_size),
+        )
+    else:
+        values = _scalar_values(sample_generator, statistic, sample_size, n_simulations)
 
     return SimulationResult(
         values=values,
         statistic_name=stat_name,
         sample_size=sample_size,
         n_simulations=n_simulations,
-        summary=sim_summary,
         metadata=metadata or {},
     )
 
 
+def _run_seeded_chunk(
+    generator_factory: GeneratorFactory,
+    statistic: Callable[..., Any],
+    sample_size: int,
+    rows: int,
+    seed: np.random.SeedSequence,
+    vectorized: bool,
+) -> np.ndarray:
+    """Worker entry point: simulate *rows* replicates from their own stream."""
+
+    sample_generator = generator_factory(np.random.default_rng(seed))
+    if vectorized:
+        return _vectorized_values(
+            sample_generator, statistic, sample_size, rows, _default_chunk_size(sample_size)
+        )
+    return _scalar_values(sample_generator, statistic, sample_size, rows)
+
+
+def run_parallel_simulation(
+    generator_factory: GeneratorFactory,
+    statistic: Callable[..., Any],
+    sample_size: int,
+    n_simulations: int,
+    seed: int | np.random.SeedSequence | None = None,
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    chunk_size: int | None = None,
+    vectorized: bool = False,
+    statistic_name: str | None = None,
+    metadata: Dict[str, Any] | None = None,
+) -> SimulationResult:
+    """Run :func:`run_statistic_simulation` in parallel across processes.
+
+    The replicates are split into chunks of *chunk_size*. Chunk ``i`` is
+    simulated with a generator built as
+    ``generator_factory(np.random.default_rng(children[i]))``, where
+    ``children`` are spawned from one :class:`numpy.random.SeedSequence`.
+    Because neither the chunking nor the streams depend on the worker
+    count, the values are bit-identical for any ``max_workers``.
+
+    Parameters
+    ----------
+    generator_factory:
+        Callable ``factory(rng) -> sample_generator`` returning a sample
+        generator (scalar or block, according to *vectorized*) that draws
+        from *rng*. Must be picklable, e.g. a module-level function or a
+        :func:`functools.partial` of one.
+    statistic:
+        Statistic as accepted by :func:`run_statistic_simulation`; must be
+        picklable.
+    sample_size, n_simulations:
+        As for :func:`run_statistic_simulation`.
+    seed:
+        Root seed (an integer or a ``SeedSequence``). If omitted, fresh
+        entropy is used. The entropy and spawn key are recorded in
+        ``metadata["seed"]`` and ``metadata["spawn_key"]``, so that
+        ``SeedSequence(seed, spawn_key=spawn_key)`` reproduces the run.
+    max_workers:
+        Number of worker processes when no *executor* is given. With
+        ``max_workers=1`` the chunks run in the calling process.
+    executor:
+        Optional existing :class:`concurrent.futures.Executor` to submit
+        chunks to (it is not shut down afterwards).
+    chunk_size:
+        Replicates per task. Defaults to splitting the run into 64 tasks.
+    vectorized:
+        Whether each chunk uses the vectorized block mode.
+    statistic_name, metadata:
+        As for :func:`run_statistic_simulation`.
+    """
+
+    if sample_size <= 0:
+        raise ValueError("sample_size must be positive.")
+    if n_simulations <= 0:
+        raise ValueError("n_simulations must be positive.")
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("max_workers must be positive.")
+
+    stat_name = statistic_name or getattr(statistic, "__name__", "statistic")
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    chunk = chunk_size or math.ceil(n_simulations / _DEFAULT_PARALLEL_TASKS)
+    sizes = list(_chunk_sizes(n_simulations, chunk))
+    tasks = [
+        (generator_factory, statistic, sample_size, rows, child, vectorized)
+        for rows, child in zip(sizes, root.spawn(len(sizes)))
+    ]
+
+    if executor is not None:
+        parts = list(executor.map(_run_seeded_chunk, *zip(*tasks)))
+    elif max_workers == 1:
+        parts = [_run_seeded_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            parts = list(pool.map(_run_seeded_chunk, *zip(*tasks)))
+
+    arr = np.concatenate(parts)
+    run_metadata = dict(metadata or {})
+    run_metadata.update(
+        {"seed": root.entropy, "spawn_key": list(root.spawn_key), "chunk_size": chunk}
+    )
+
+    return SimulationResult(
+        values=arr,
+        statistic_name=stat_name,
+        sample_size=sample_size,
+        n_simulations=n_simulations,
+        metadata=run_metadata,
+    )
+
+
+def run_multi_statistic_simulation(
+    sample_generator: SampleGenerator,
+    statistics: Mapping[str, Callable[..., Any]],
+    sample_size: int,
+    n_simulations: int,
+    metadata: Dict[str, Any] | None = None,
+    vectorized: bool = False,
+    chunk_size: int | None = None,
+) -> Dict[str, SimulationResult]:
+    """Simulate several statistics on the *same* random samples.
+
+    Each drawn sample (or block of samples in vectorized mode) is passed to
+    every statistic before the next one is drawn. This costs one generator
+    call per replicate instead of one per statistic and replicate, and it
+    preserves the pairing between statistics: ``results[a].values[i]`` and
+    ``results[b].values[i]`` were computed from the same sample, so their
+    joint behaviour (e.g. correlation of mean and median) can be studied.
+
+    Parameters
+    ----------
+    sample_generator:
+        As for :func:`run_statistic_simulation`.
+    statistics:
+        Mapping from a statistic name to a statistic callable (scalar or
+        block form, according to *vectorized*). The names are used as
+        ``statistic_name`` of the results.
+    sample_size, n_simulations, metadata, vectorized, chunk_size:
+        As for :func:`run_statistic_simulation`.
+
+    Returns
+    -------
+    dict of str to SimulationResult
+        One result per statistic, in the order of *statistics*.
+    """
+
+    if sample_size <= 0:
+        raise ValueError("sample_size must be positive.")
+    if n_simulations <= 0:
+        raise ValueError("n_simulations must be positive.")
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    if not statistics:
+        raise ValueError("statistics must contain at least one statistic.")
+
+    columns = {name: np.empty(n_simulations, dtype=float) for name in statistics}
+    if vectorized:
+        chunk = chunk_size or _default_chunk_size(sample_size)
+        buffer = _block_buffer(sample_generator, sample_size, chunk)
+        start = 0
+        for rows in _chunk_sizes(n_simulations, chunk):
+            block = _draw_block(sample_generator, sample_size, rows, buffer)  # type: ignore[arg-type]
+            for name, statistic in statistics.items():
+                columns[name][start : start + rows] = _reduce_block(statistic, block)
+            start += rows
+    else:
+        for i in range(n_simulations):
+            sample = _draw_sample(sample_generator, sample_size)
+            for name, statistic in statistics.items():
+                columns[name][i] = float(statistic(sample))
+
+    return {
+        name: SimulationResult(
+            values=columns[name],
+            statistic_name=name,
+            sample_size=sample_size,
+            n_simulations=n_simulations,
+            metadata=dict(metadata or {}),
+        )
+        for name in statistics
+    }
+
+
 __all__ = [
     "SimulationResult",
     "run_statistic_simulation",
+    "run_parallel_simulation",
+    "run_multi_statistic_simulation",
 ]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.checkpoint import resume_simulation, run_checkpointed_simulation
+
+
+class Preempted(RuntimeError):
+    pass
+
+
+def normal_factory(rng):
+    return lambda size: rng.normal(size=size)
+
+
+def failing_factory(calls_before_failure):
+    def factory(rng):
+        calls = [0]
+
+        def gen(size):
+            calls[0] += 1
+            if calls[0] > calls_before_failure:
+                raise Preempted
+            return rng.normal(size=size)
+
+        return gen
+
+    return factory
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_resume_matches_uninterrupted_run(tmp_path, vectorized) -> None:
+    statistic = (lambda b, axis: np.median(b, axis=axis)) if vectorized else np.median
+    kwargs = dict(sample_size=8, n_simulations=500, seed=42, vectorized=vectorized, chunk_size=64)
+    full = run_checkpointed_simulation(
+        normal_factory, statistic, checkpoint_path=tmp_path / "full.npz", **kwargs
+    )
+
+    path = tmp_path / "run.npz"
+    # Fail part-way through the fourth chunk (scalar mode draws per replicate).
+    fail_after = 3 if vectorized else 3 * 64 + 10
+    with pytest.raises(Preempted):
+        run_checkpointed_simulation(
+            failing_factory(fail_after), statistic, checkpoint_path=path, checkpoint_every=0, **kwargs
+        )
+    resumed = resume_simulation(path, normal_factory, statistic, statistic_name="median")
+
+    np.testing.assert_array_equal(resumed.values, full.values)
+    assert resumed.summary == full.summary
+    assert resumed.metadata["seed"] == 42
+    assert resumed.metadata["spawn_key"] == []
+    # The finished checkpoint rebuilds the same result again.
+    again = resume_simulation(path, normal_factory, statistic)
+    np.testing.assert_array_equal(again.values, full.values)
+
+
+def test_streaming_checkpoint_restores_sketch(tmp_path) -> None:
+    kwargs = dict(
+        sample_size=4, n_simulations=3000, seed=7, vectorized=True, chunk_size=200, streaming=True
+    )
+    statistic = lambda b, axis: b.mean(axis=axis)  # noqa: E731
+    full = run_checkpointed_simulation(
+        normal_factory, statistic, checkpoint_path=tmp_path / "full.npz", **kwargs
+    )
+
+    path = tmp_path / "run.npz"
+    with pytest.raises(Preempted):
+        run_checkpointed_simulation(
+            failing_factory(9), statistic, checkpoint_path=path, checkpoint_every=0, **kwargs
+        )
+    resumed = resume_simulation(path, normal_factory, statistic)
+
+    assert resumed.values.size == 0
+    assert resumed.summary == full.summary
+    assert resumed.sketch.to_bytes() == full.sketch.to_bytes()
+
+
+def test_checkpoints_do_not_rewrite_values(tmp_path) -> None:
+    path = tmp_path / "run.npz"
+    with pytest.raises(Preempted):
+        run_checkpointed_simulation(
+            failing_factory(5), np.mean, 4, 10_000, path, seed=1, vectorized=True,
+            chunk_size=1000, checkpoint_every=0,
+        )
+
+    with np.load(path) as data:
+        assert data.files == ["header"]
+    assert np.load(f"{path}.values.npy", mmap_mode="r").shape == (10_000,)
+
+    result = resume_simulation(path, normal_factory, np.mean)
+    assert isinstance(result.values, np.memmap)
+    assert np.count_nonzero(result.values) == 10_000
+
+
+def test_resume_rejects_foreign_files(tmp_path) -> None:
+    path = tmp_path / "other.npz"
+    np.savez(path, header=np.array('{"format": 99}'))
+    with pytest.raises(ValueError):
+        resume_simulation(path, normal_factory, np.mean)
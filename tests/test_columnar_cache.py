@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from src import columnar_cache
+from src.columnar_cache import load_sales_columns, sidecar_dir
+from src.sales_data import read_sales_csv
+
+SAMPLE = Path(__file__).resolve().parents[1] / "data" / "sample_sales_data.csv"
+
+
+def _copy_sample(tmp_path) -> Path:
+    path = tmp_path / "sales.csv"
+    shutil.copy(SAMPLE, path)
+    return path
+
+
+def _count_builds(monkeypatch) -> list:
+    builds = []
+    original = columnar_cache.build_sales_cache
+
+    def counting(*args, **kwargs):
+        builds.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(columnar_cache, "build_sales_cache", counting)
+    return builds
+
+
+def test_cache_matches_parsed_csv_and_is_memory_mapped(tmp_path, monkeypatch) -> None:
+    path = _copy_sample(tmp_path)
+    builds = _count_builds(monkeypatch)
+    expected, expected_regions = read_sales_csv(path)
+
+    for _ in range(2):
+        columns, regions = load_sales_columns(path)
+        assert regions == expected_regions
+        for name, col in expected.items():
+            assert isinstance(columns[name], np.memmap)
+            np.testing.assert_array_equal(columns[name], col)
+            assert columns[name].dtype == col.dtype
+    assert len(builds) == 1
+    assert os.path.isfile(os.path.join(sidecar_dir(path), "manifest.json"))
+
+
+def test_cache_rebuilds_only_when_content_changes(tmp_path, monkeypatch) -> None:
+    path = _copy_sample(tmp_path)
+    load_sales_columns(path)
+    builds = _count_builds(monkeypatch)
+
+    os.utime(path, ns=(1, 1))  # touched, same content: hash check only
+    load_sales_columns(path)
+    assert builds == []
+
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write("2024-01-06,4,Central,40,800.00\n")
+    columns, regions = load_sales_columns(path)
+    assert len(builds) == 1
+    assert columns["store_id"][-1] == 4
+    assert regions[columns["region"][-1]] == "Central"
+
+
+def test_same_size_edit_is_detected(tmp_path) -> None:
+    path = _copy_sample(tmp_path)
+    load_sales_columns(path, mmap_mode=None)
+    text = path.read_text().replace("460.50", "460.51")
+    path.write_text(text)
+    os.utime(path, ns=(10**18, 10**18))
+
+    columns, _ = load_sales_columns(path, mmap_mode=None)
+    assert columns["total_revenue"][0] == 460.51
+
+
+def test_empty_csv_is_cached(tmp_path) -> None:
+    path = tmp_path / "empty.csv"
+    path.write_text("date,store_id,region,items_sold,total_revenue\n")
+    columns, regions = load_sales_columns(path, cache_dir=tmp_path / "cache")
+    assert regions == []
+    assert all(col.size == 0 for col in columns.values())
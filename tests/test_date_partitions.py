@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.date_partitions import DatePartitionStore, date_slice
+from src.sales_data import read_sales_csv
+
+SAMPLE = Path(__file__).resolve().parents[1] / "data" / "sample_sales_data.csv"
+
+
+def test_date_slice_uses_half_open_window() -> None:
+    dates = np.array(["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-05"], dtype="M8[D]")
+    assert date_slice(dates, "2024-01-02", "2024-01-05") == slice(1, 3)
+    assert date_slice(dates, None, "2024-01-02") == slice(0, 1)
+    assert date_slice(dates, "2024-02-01") == slice(4, 4)
+
+
+def test_range_query_prunes_partitions(tmp_path) -> None:
+    store = DatePartitionStore(tmp_path / "store", freq="D")
+    assert store.append_csv(SAMPLE) == 15
+    assert store.partitions == [f"2024-01-0{d}" for d in range(1, 6)]
+    assert store.partitions_for("2024-01-02", "2024-01-04") == ["2024-01-02", "2024-01-03"]
+
+    columns, regions = read_sales_csv(SAMPLE)
+    window = (columns["date"] >= np.datetime64("2024-01-02")) & (
+        columns["date"] < np.datetime64("2024-01-04")
+    )
+    result = store.query("2024-01-02", "2024-01-04")
+    for name, col in columns.items():
+        np.testing.assert_array_equal(np.sort(result[name]), np.sort(col[window]))
+    assert store.summary("total_revenue", "2024-01-02", "2024-01-04")["mean"] == pytest.approx(
+        columns["total_revenue"][window].mean()
+    )
+
+    reopened = DatePartitionStore(tmp_path / "store")
+    assert reopened.freq == "D" and reopened.regions == regions
+    assert reopened.query("2024-02-01")["date"].size == 0
+
+
+def test_appending_out_of_order_rows_keeps_partitions_sorted(tmp_path) -> None:
+    store = DatePartitionStore(tmp_path / "store")
+    late = tmp_path / "late.csv"
+    late.write_text(
+        "date,store_id,region,items_sold,total_revenue\n"
+        "2024-01-03,9,Central,1,10.0\n"
+        "2024-02-01,9,Central,2,20.0\n"
+    )
+    store.append_csv(late)
+    store.append_csv(SAMPLE)
+
+    assert store.partitions == ["2024-01", "2024-02"]
+    assert store.row_count == 17
+    january = store.query("2024-01-01", "2024-02-01")
+    assert np.all(np.diff(january["date"].astype(np.int64)) >= 0)
+    assert january["date"].size == 16
+    assert store.regions[0] == "Central"
+    only_store_9 = store.query("2024-01-03", "2024-01-04", columns=("store_id",))
+    assert sorted(only_store_9["store_id"].tolist()) == [1, 2, 3, 9]
+
+
+def test_failed_file_leaves_regions_unchanged(tmp_path) -> None:
+    store = DatePartitionStore(tmp_path / "store")
+    store.append_csv(SAMPLE)
+    regions = list(store.regions)
+    bad = tmp_path / "bad.csv"
+    bad.write_text(
+        "date,store_id,region,items_sold,total_revenue\n"
+        "2024-01-06,9,Atlantis,1,10.0\n"
+        "2024-01-06,9,Atlantis,oops,10.0\n"
+    )
+    with pytest.raises(ValueError):
+        store.append_csv(bad, chunk_rows=1)
+    assert store.regions == regions
+
+    late = tmp_path / "late.csv"
+    late.write_text("date,store_id,region,items_sold,total_revenue\n2024-01-06,1,North,1,10.0\n")
+    store.append_csv(late)
+    assert DatePartitionStore(tmp_path / "store").regions == regions
+    assert store.row_count == 16
+
+
+@pytest.mark.parametrize("crash_in", ["_save_manifest", "_swap_in"])
+def test_interrupted_append_is_not_duplicated(tmp_path, monkeypatch, crash_in) -> None:
+    store = DatePartitionStore(tmp_path / "store")
+    store.append_csv(SAMPLE)
+    late = tmp_path / "late.csv"
+    late.write_text("date,store_id,region,items_sold,total_revenue\n2024-01-06,1,North,1,10.0\n")
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as patch:
+        patch.setattr(DatePartitionStore, crash_in, crash)
+        with pytest.raises(KeyboardInterrupt):
+            store.append_csv(late)
+
+    reopened = DatePartitionStore(tmp_path / "store")
+    if crash_in == "_save_manifest":
+        # Crashed before the manifest listed the new partition: retry.
+        assert reopened.row_count == 15
+        reopened.append_csv(late)
+    assert reopened.row_count == 16
+    assert reopened.query()["date"].size == 16
+    assert sorted(p.name for p in (tmp_path / "store").iterdir()) == ["2024-01", "manifest.json"]
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.distributions import (
+    BootstrapGenerator,
+    DistributionGenerator,
+    ExponentialGenerator,
+    NormalGenerator,
+    PoissonGenerator,
+    UniformGenerator,
+)
+from src.simulation import run_statistic_simulation
+
+
+@pytest.mark.parametrize(
+    "gen, mean, var",
+    [
+        (NormalGenerator(1.0, 2.0, seed=0), 1.0, 4.0),
+        (UniformGenerator(-1.0, 1.0, seed=0), 0.0, 1.0 / 3.0),
+        (ExponentialGenerator(0.5, seed=0), 0.5, 0.25),
+        (PoissonGenerator(3.0, seed=0), 3.0, 3.0),
+        (BootstrapGenerator([1.0, 2.0, 6.0], seed=0), 3.0, 14.0 / 3.0),
+    ],
+)
+def test_generators_fill_buffers_in_place(gen, mean, var) -> None:
+    out = np.empty((2000, 50))
+    block = gen.fill(out)
+
+    assert block is out
+    assert out.mean() == pytest.approx(mean, abs=0.05 * (1 + mean))
+    assert out.var() == pytest.approx(var, rel=0.05)
+    assert gen(7).shape == (7,)
+
+
+def test_fill_generators_work_in_scalar_and_vectorized_simulation() -> None:
+    scalar = run_statistic_simulation(NormalGenerator(seed=3), np.mean, 10, 500)
+    vector = run_statistic_simulation(
+        NormalGenerator(seed=3), np.mean, 10, 500, vectorized=True, chunk_size=64
+    )
+    # One stream, consumed in the same row-major order by both modes.
+    np.testing.assert_allclose(scalar.values, vector.values)
+
+
+def test_bootstrap_generator_only_returns_dataset_values() -> None:
+    data = [3.0, 5.0, 8.0]
+    out = BootstrapGenerator(data, seed=1)((100, 9))
+    assert set(np.unique(out)) <= set(data)
+
+
+def test_subclass_without_fill_cannot_be_created() -> None:
+    class Incomplete(DistributionGenerator):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(seed=0)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.grouped_stats import factorize, grouped_summary, week_start
+from src.numpy_stats import np_summary
+from src.sales_data import read_sales_csv
+
+SAMPLE = Path(__file__).resolve().parents[1] / "data" / "sample_sales_data.csv"
+
+
+def test_factorize_composite_keys() -> None:
+    a = np.array([2, 1, 2, 1, 2])
+    b = np.array(["y", "x", "x", "x", "y"])
+    codes, uniques = factorize((a, b))
+
+    groups = list(zip(*(u.tolist() for u in uniques)))
+    assert groups == [(1, "x"), (2, "x"), (2, "y")]
+    assert [groups[c] for c in codes] == list(zip(a.tolist(), b.tolist()))
+
+
+def test_grouped_summary_matches_np_summary_per_group() -> None:
+    rng = np.random.default_rng(0)
+    keys = rng.integers(0, 7, size=2000)
+    values = rng.normal(size=2000)
+
+    result = grouped_summary(values, keys)
+
+    assert list(result) == sorted(set(keys.tolist()))
+    for key, summary in result.items():
+        assert summary == pytest.approx(np_summary(values[keys == key]))
+
+
+def test_grouped_summary_on_sales_columns() -> None:
+    columns, regions = read_sales_csv(SAMPLE)
+    by_region = grouped_summary(columns["total_revenue"], columns["region"])
+    south = by_region[regions.index("South")]
+    assert south["count"] == 5.0
+    assert south["max"] == 672.00
+
+    weekly = grouped_summary(
+        columns["items_sold"], (columns["store_id"], week_start(columns["date"]))
+    )
+    # 2024-01-01 is a Monday, so every row falls into the same week.
+    assert len(weekly) == 3
+    assert weekly[(1, np.datetime64("2024-01-01").item())]["count"] == 5.0
+
+
+def test_week_start_is_monday() -> None:
+    dates = np.array(["2023-12-31", "2024-01-01", "2024-01-07", "2024-01-08"], dtype="M8[D]")
+    expected = np.array(["2023-12-25", "2024-01-01", "2024-01-01", "2024-01-08"], dtype="M8[D]")
+    np.testing.assert_array_equal(week_start(dates), expected)
+
+
+def test_single_row_groups_have_nan_std() -> None:
+    result = grouped_summary([1.0, 2.0, 4.0], [0, 1, 1])
+    assert np.isnan(result[0]["std"])
+    assert result[1]["median"] == 3.0
+
+
+def test_grouped_summary_validates_lengths() -> None:
+    with pytest.raises(ValueError):
+        grouped_summary([1.0, 2.0], [0, 1, 1])
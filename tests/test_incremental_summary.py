@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import math
+
+import pytest
+
+from src.grouped_stats import grouped_summary
+from src.incremental_summary import IncrementalSalesSummary
+from src.sales_data import read_sales_csv
+
+SAMPLE = Path(__file__).resolve().parents[1] / "data" / "sample_sales_data.csv"
+
+
+def _split_by_day(tmp_path) -> list:
+    header, *rows = SAMPLE.read_text().splitlines()
+    days = {}
+    for row in rows:
+        days.setdefault(row.split(",")[0], []).append(row)
+    paths = []
+    for day, day_rows in days.items():
+        path = tmp_path / f"sales_{day}.csv"
+        path.write_text("\n".join([header, *day_rows]) + "\n")
+        paths.append(path)
+    return paths
+
+
+def test_daily_appends_match_full_history(tmp_path) -> None:
+    state_path = tmp_path / "state.npz"
+    IncrementalSalesSummary().save(state_path)
+    for path in _split_by_day(tmp_path):
+        state = IncrementalSalesSummary.load(state_path)
+        assert state.append_csv(path) == 3
+        state.save(state_path)
+
+    state = IncrementalSalesSummary.load(state_path)
+    columns, regions = read_sales_csv(SAMPLE)
+    revenue = columns["total_revenue"]
+
+    assert state.row_count == 15
+    overall = state.summary("total_revenue")
+    assert overall["mean"] == pytest.approx(revenue.mean())
+    assert overall["std"] == pytest.approx(revenue.std(ddof=1))
+    assert overall["max"] == revenue.max()
+
+    exact = grouped_summary(revenue, columns["region"])
+    by_region = state.grouped_summary("total_revenue", by="region")
+    assert sorted(by_region) == sorted(regions)
+    for code, summary in exact.items():
+        incremental = by_region[regions[code]]
+        for key in ("count", "mean", "std", "min", "max"):
+            assert incremental[key] == pytest.approx(summary[key], nan_ok=True)
+
+    by_store = state.grouped_summary("items_sold", by="store_id")
+    assert list(by_store) == [1, 2, 3]
+    assert by_store[3]["count"] == 5.0
+
+
+def test_already_added_files_are_skipped(tmp_path) -> None:
+    state = IncrementalSalesSummary()
+    assert state.append_csv(SAMPLE) == 15
+    assert state.append_csv(SAMPLE) == 0
+    assert state.row_count == 15
+
+
+def test_single_row_groups_have_nan_std(tmp_path) -> None:
+    path = tmp_path / "sales.csv"
+    path.write_text(
+        "date,store_id,region,items_sold,total_revenue\n"
+        "2024-01-01,1,North,10,100.0\n"
+        "2024-01-01,1,North,20,200.0\n"
+        "2024-01-01,2,South,5,50.0\n"
+    )
+    state = IncrementalSalesSummary()
+    state.append_csv(path)
+
+    by_region = state.grouped_summary("total_revenue", by="region")
+    assert by_region["North"]["std"] == pytest.approx(70.710678)
+    assert math.isnan(by_region["South"]["std"])
+    assert by_region["South"]["median"] == 50.0
+    assert math.isnan(state.grouped_summary("items_sold", by="store_id")[2]["std"])
+
+
+def test_failed_file_leaves_state_unchanged(tmp_path) -> None:
+    header, *rows = SAMPLE.read_text().splitlines()
+    path = tmp_path / "sales.csv"
+    path.write_text("\n".join([header, *rows[:10], "2024-01-04,1,North,oops,1.0"]) + "\n")
+    state = IncrementalSalesSummary()
+    with pytest.raises(ValueError):
+        state.append_csv(path, chunk_rows=4)
+    assert state.row_count == 0
+    assert state.regions == []
+    assert state.files == []
+
+    path.write_text("\n".join([header, *rows]) + "\n")
+    assert state.append_csv(path, chunk_rows=4) == 15
+    assert state.row_count == 15
+    assert state.grouped_summary("items_sold", by="store_id")[3]["count"] == 5.0
+
+
+def test_unknown_columns_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        IncrementalSalesSummary(columns=("profit",))
+    with pytest.raises(KeyError):
+        IncrementalSalesSummary().grouped_summary("total_revenue", by="date")
+
+
+def test_date_groups_round_trip(tmp_path) -> None:
+    state = IncrementalSalesSummary(columns=("items_sold",), group_by=("date",))
+    state.append_csv(SAMPLE)
+    state.save(tmp_path / "state.npz")
+
+    by_day = IncrementalSalesSummary.load(tmp_path / "state.npz").grouped_summary(
+        "items_sold", by="date"
+    )
+    assert list(by_day)[0] == "2024-01-01"
+    assert by_day["2024-01-01"]["max"] == 34.0
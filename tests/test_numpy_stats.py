@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from src import numpy_stats as nps
+from src import pure_python_stats as pps
+
+
+def test_quantiles_match_single_quantile_calls() -> None:
+    rng = random.Random(3)
+    data = [rng.gauss(0.0, 1.0) for _ in range(257)]
+    deciles = [i / 10 for i in range(1, 10)]
+
+    pure = pps.quantiles(iter(data), deciles)
+    vec = nps.np_quantiles(data, deciles)
+
+    assert pure == [pps.quantile(data, q) for q in deciles]
+    assert isinstance(vec, np.ndarray)
+    np.testing.assert_allclose(vec, [nps.np_quantile(data, q) for q in deciles])
+    np.testing.assert_allclose(vec, pure)
+
+
+@pytest.mark.parametrize("func", [pps.quantiles, nps.np_quantiles])
+def test_quantiles_reject_out_of_range_probabilities(func) -> None:
+    with pytest.raises(ValueError):
+        func([1.0, 2.0], [0.5, 1.5])
+
+
+def test_to_ndarray_wraps_float64_buffers_without_copying() -> None:
+    from array import array
+
+    base = np.arange(10, dtype=float)
+    buf = array("d", [1.0, 2.0, 3.0])
+
+    assert np.shares_memory(nps._to_ndarray(base), base)
+    assert np.shares_memory(nps._to_ndarray(memoryview(base)), base)
+    assert np.shares_memory(nps._to_ndarray(buf), np.frombuffer(buf))
+
+    assert nps.np_mean(array("i", [1, 2, 3])) == 2.0
+    assert nps.np_mean(x for x in [1.0, 2.0, 3.0]) == 2.0
+    with pytest.raises(ValueError):
+        nps.np_mean(array("d"))
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_summary_batch_matches_per_series_summary(axis: int) -> None:
+    rng = np.random.default_rng(5)
+    matrix = rng.standard_normal((6, 11))
+
+    batch = nps.np_summary_batch(matrix, axis=axis)
+    series = matrix if axis == 1 else matrix.T
+
+    assert batch.keys() == nps.np_summary(series[0]).keys()
+    for i, row in enumerate(series):
+        expected = nps.np_summary(row)
+        for key, value in expected.items():
+            assert batch[key][i] == pytest.approx(value)
+
+    with pytest.raises(ValueError):
+        nps.np_summary_batch(matrix[0])
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src import pure_python_stats as pps
+
+
+def test_summary_matches_individual_statistics() -> None:
+    rng = random.Random(0)
+    data = [rng.gauss(10.0, 3.0) for _ in range(1001)]
+
+    result = pps.summary(data)
+
+    assert result["count"] == 1001.0
+    assert result["mean"] == pytest.approx(pps.mean(data))
+    assert result["std"] == pytest.approx(pps.std_dev(data, ddof=1))
+    assert result["min"] == pps.minimum(data)
+    assert result["max"] == pps.maximum(data)
+    assert result["median"] == pps.median(data)
+    assert result["q25"] == pps.quantile(data, 0.25)
+    assert result["q75"] == pps.quantile(data, 0.75)
+    assert result["iqr"] == pytest.approx(pps.iqr(data))
+    assert result["range"] == pytest.approx(pps.data_range(data))
+
+
+def test_summary_accepts_single_use_iterables() -> None:
+    result = pps.summary(float(x) for x in [4, 1, 3, 2])
+    assert result["median"] == 2.5
+    assert result["min"] == 1.0
+    assert result["max"] == 4.0
+
+
+def test_summary_requires_two_values() -> None:
+    with pytest.raises(ValueError):
+        pps.summary([1.0])
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 2000, 5001])
+def test_selection_matches_sorting(n: int) -> None:
+    rng = random.Random(n)
+    data = [float(rng.randint(0, 50)) for _ in range(n)]
+    ordered = sorted(data)
+
+    for q in (0.0, 0.1, 0.25, 0.5, 0.9, 1.0):
+        assert pps.quantile(data, q) == pps._interpolate_sorted(ordered, q)
+    for k in {0, n // 3, n - 1}:
+        assert pps.select_kth(data, k) == ordered[k]
+
+
+def test_selection_inplace_partitions_caller_buffer() -> None:
+    rng = random.Random(7)
+    data = [rng.random() for _ in range(3001)]
+    expected = sorted(data)[1200]
+
+    buffer = list(data)
+    assert pps.select_kth(buffer, 1200, inplace=True) == expected
+    assert buffer[1200] == expected
+    assert max(buffer[:1200]) <= expected <= min(buffer[1201:])
+    assert sorted(buffer) == sorted(data)
+
+    assert pps.median(list(data), inplace=True) == pps.median(data)
+    with pytest.raises(TypeError):
+        pps.median(tuple(data), inplace=True)
+    with pytest.raises(ValueError):
+        pps.select_kth(data, len(data))
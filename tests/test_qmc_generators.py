@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.qmc_generators import qmc_exponential, qmc_lognormal, qmc_normal, qmc_uniform
+from src.simulation import run_statistic_simulation
+
+
+@pytest.mark.parametrize(
+    "factory, expected_mean",
+    [
+        (lambda d: qmc_normal(d, loc=2.0, seed=0), 2.0),
+        (lambda d: qmc_uniform(d, low=-1.0, high=3.0, seed=0), 1.0),
+        (lambda d: qmc_exponential(d, scale=0.5, seed=0), 0.5),
+        (lambda d: qmc_lognormal(d, sigma=0.5, method="halton", seed=0), np.exp(0.125)),
+    ],
+)
+def test_qmc_generators_have_correct_marginals(factory, expected_mean) -> None:
+    block = factory(4)((4096, 4))
+    assert block.shape == (4096, 4)
+    assert np.isfinite(block).all()
+    assert block.mean() == pytest.approx(expected_mean, rel=1e-2)
+
+
+def test_qmc_generator_plugs_into_both_simulation_modes() -> None:
+    scalar = run_statistic_simulation(qmc_normal(6, seed=1), np.var, 6, 256)
+    vector = run_statistic_simulation(
+        qmc_normal(6, seed=1), np.var, 6, 256, vectorized=True, chunk_size=64
+    )
+    np.testing.assert_allclose(scalar.values, vector.values)
+
+    with pytest.raises(ValueError):
+        run_statistic_simulation(qmc_normal(6, seed=1), np.var, 5, 10)
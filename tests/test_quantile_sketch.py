@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src import pure_python_stats as pps
+from src.quantile_sketch import KLLSketch
+
+
+def _uniform(n: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(n)]
+
+
+def test_sketch_quantiles_are_within_rank_error() -> None:
+    data = _uniform(200_000, seed=0)
+    sketch = KLLSketch(k=200, seed=1).update_many(iter(data))
+
+    for q in (0.05, 0.25, 0.5, 0.75, 0.95, 0.99):
+        assert abs(sketch.quantile(q) - q) < 0.02
+    assert sketch.count == len(data)
+    assert sketch.quantile(0.0) == min(data)
+    assert sketch.quantile(1.0) == max(data)
+
+
+def test_sketch_merge_and_serialization_round_trip() -> None:
+    data = _uniform(50_000, seed=2)
+    shards = [KLLSketch(seed=i).update_many(data[i::4]) for i in range(4)]
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+
+    restored = KLLSketch.from_bytes(merged.to_bytes())
+    assert restored.summary() == merged.summary()
+    assert abs(restored.quantile(0.5) - 0.5) < 0.02
+
+    with pytest.raises(ValueError):
+        merged.merge(KLLSketch(k=100))
+
+
+def test_restored_rng_state_continues_identically() -> None:
+    original = KLLSketch(k=16, seed=4).update_many(_uniform(5000, seed=5))
+    restored = KLLSketch.from_bytes(original.to_bytes()).set_rng_state(original.rng_state())
+
+    more = _uniform(5000, seed=6)
+    original.update_many(more)
+    restored.update_many(more)
+    assert restored.to_bytes() == original.to_bytes()
+    assert restored.rng_state() == original.rng_state()
+
+
+def test_sketch_summary_has_exact_summary_keys() -> None:
+    data = _uniform(1000, seed=3)
+    approx = KLLSketch().update_many(data).summary()
+    exact = pps.summary(data)
+
+    assert approx.keys() == exact.keys()
+    for key in ("count", "min", "max", "range"):
+        assert approx[key] == exact[key]
+    assert approx["mean"] == pytest.approx(exact["mean"])
+    assert approx["std"] == pytest.approx(exact["std"])
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.resampling import bootstrap, permutation_test
+
+
+def test_bootstrap_percentile_interval_covers_mean() -> None:
+    data = np.random.default_rng(0).normal(5.0, 2.0, size=400)
+    result = bootstrap(data, np.mean, n_resamples=2000, seed=1, chunk_size=300)
+
+    assert result.values.shape == (2000,)
+    assert result.estimate == pytest.approx(data.mean())
+    assert result.ci_lower < result.estimate < result.ci_upper
+    # Bootstrap SE of the mean approximates s / sqrt(n).
+    assert result.standard_error == pytest.approx(data.std(ddof=1) / 20.0, rel=0.15)
+
+
+def test_bootstrap_is_reproducible_and_independent_of_chunking() -> None:
+    data = np.arange(50.0)
+    a = bootstrap(data, np.median, n_resamples=500, seed=3, chunk_size=7)
+    b = bootstrap(data, np.median, n_resamples=500, seed=3, chunk_size=7)
+    c = bootstrap(data, np.median, n_resamples=500, seed=3, chunk_size=1000)
+    np.testing.assert_array_equal(a.values, b.values)
+    np.testing.assert_array_equal(a.values, c.values)
+    assert (a.ci_lower, a.ci_upper) == (c.ci_lower, c.ci_upper)
+
+
+def test_bca_interval_shifts_towards_skewed_tail() -> None:
+    data = np.random.default_rng(2).exponential(1.0, size=60)
+    pct = bootstrap(data, np.mean, n_resamples=4000, seed=4)
+    bca = bootstrap(data, np.mean, n_resamples=4000, seed=4, method="bca")
+
+    np.testing.assert_array_equal(pct.values, bca.values)
+    assert bca.method == "bca"
+    assert bca.ci_lower < bca.estimate < bca.ci_upper
+    # Right-skewed data: BCa moves both bounds upwards.
+    assert bca.ci_upper > pct.ci_upper
+    assert bca.ci_lower > pct.ci_lower
+
+
+def test_bca_grouped_jackknife_for_large_data() -> None:
+    data = np.random.default_rng(5).normal(size=5000)
+    result = bootstrap(data, np.mean, n_resamples=200, seed=6, method="bca")
+    assert result.ci_lower < result.estimate < result.ci_upper
+
+
+def test_permutation_test_detects_shift() -> None:
+    rng = np.random.default_rng(7)
+    x = rng.normal(1.0, 1.0, size=40)
+    y = rng.normal(0.0, 1.0, size=50)
+
+    shifted = permutation_test(x, y, n_permutations=2000, seed=8, chunk_size=128)
+    assert shifted.statistic == pytest.approx(x.mean() - y.mean())
+    assert shifted.null_distribution.shape == (2000,)
+    assert shifted.p_value < 0.01
+
+    greater = permutation_test(x, y, n_permutations=2000, seed=8, alternative="greater")
+    less = permutation_test(x, y, n_permutations=2000, seed=8, alternative="less")
+    assert greater.p_value < 0.01
+    assert less.p_value > 0.99
+
+
+def test_resampling_rejects_bad_arguments() -> None:
+    with pytest.raises(ValueError):
+        bootstrap([1.0], np.mean)
+    with pytest.raises(ValueError):
+        bootstrap([1.0, 2.0], np.mean, method="basic")
+    with pytest.raises(ValueError):
+        permutation_test([1.0], [2.0], alternative="both")
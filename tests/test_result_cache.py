@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import functools
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+
+from src.result_cache import ResultCache, spec_key
+
+
+def normal_factory(rng, loc=0.0):
+    return lambda size: rng.normal(loc, 1.0, size=size)
+
+
+def block_mean(block, axis):
+    return block.mean(axis=axis)
+
+
+def test_repeated_run_is_served_from_cache(tmp_path) -> None:
+    cache = ResultCache(tmp_path)
+    kwargs = dict(sample_size=10, n_simulations=200, seed=1, vectorized=True, max_workers=1)
+    first = cache.run(normal_factory, block_mean, **kwargs)
+    second = cache.run(normal_factory, block_mean, **kwargs)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    np.testing.assert_array_equal(np.asarray(second.values), first.values)
+    assert second.summary == first.summary
+    assert second.metadata["seed"] == 1
+    assert sorted(name.rsplit(".", 1)[1] for name in os.listdir(tmp_path)) == ["json", "npy"]
+
+
+def test_key_depends_on_spec() -> None:
+    base = {"generator": normal_factory, "statistic": block_mean, "seed": 1}
+    assert spec_key(base) == spec_key(dict(base))
+    assert spec_key(base) != spec_key({**base, "seed": 2})
+    shifted = {**base, "generator": functools.partial(normal_factory, loc=1.0)}
+    assert spec_key(shifted) != spec_key(base)
+    assert spec_key({**base, "statistic": lambda b, axis: b.max(axis=axis)}) != spec_key(
+        {**base, "statistic": lambda b, axis: b.min(axis=axis)}
+    )
+
+
+class ScaledMean:
+    def __init__(self, scale):
+        self.scale = scale
+
+    def __call__(self, block, axis):
+        return self.scale * block.mean(axis=axis)
+
+
+def test_key_depends_on_closures_defaults_and_instance_state() -> None:
+    def shifted_factory(shift):
+        return lambda rng: lambda size: rng.normal(shift, 1.0, size=size)
+
+    def key(generator, statistic=block_mean):
+        return spec_key({"generator": generator, "statistic": statistic, "seed": 1})
+
+    assert key(shifted_factory(0.0)) == key(shifted_factory(0.0))
+    assert key(shifted_factory(0.0)) != key(shifted_factory(5.0))
+    assert key(normal_factory) != key(lambda rng, loc=1.0: normal_factory(rng, loc))
+    assert key(normal_factory, ScaledMean(0)) == key(normal_factory, ScaledMean(0))
+    assert key(normal_factory, ScaledMean(0)) != key(normal_factory, ScaledMean(5))
+
+
+def test_key_is_stable_across_interpreter_sessions(tmp_path) -> None:
+    script = tmp_path / "key.py"
+    script.write_text(
+        textwrap.dedent(
+            """
+            import functools
+            from src.result_cache import spec_key
+
+            def factory(rng):
+                return lambda size: rng.normal(0.0, 1.0, size=size)
+
+            print(spec_key({
+                "generator": lambda rng: lambda size: rng.gamma(2.0, size=size),
+                "nested": factory,
+                "partial": functools.partial(factory),
+                "statistic": lambda b, axis: b.mean(axis=axis) if {1, 2} else None,
+                "seed": 3,
+            }))
+            """
+        )
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    keys = set()
+    for hash_seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": hash_seed, "PYTHONPATH": root}
+        output = subprocess.run(
+            [sys.executable, str(script)], env=env, cwd=root,
+            capture_output=True, text=True, check=True,
+        )
+        keys.add(output.stdout.strip())
+    assert len(keys) == 1
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path) -> None:
+    result = ResultCache(tmp_path / "src").run(
+        normal_factory, block_mean, 5, 100, seed=0, vectorized=True, max_workers=1
+    )
+    entry_bytes = sum(f.stat().st_size for f in (tmp_path / "src").iterdir())
+    cache = ResultCache(tmp_path / "lru", max_bytes=3 * entry_bytes + 100)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, result)
+        os.utime(tmp_path / "lru" / f"{key}.json", (i, i))
+    cache.get("a")  # refresh "a"
+    cache.put("d", result)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("d") is not None
+
+
+def test_unseeded_runs_are_not_cached(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        ResultCache(tmp_path).run(normal_factory, block_mean, 5, 10, seed=None)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from src import pure_python_stats as pps
+from src.running_stats import RunningCovariance, RunningMoments
+
+
+def _data(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [rng.gauss(5.0, 2.0) for _ in range(n)]
+
+
+def test_running_moments_match_list_functions() -> None:
+    data = _data(500)
+    acc = RunningMoments().update_many(iter(data))
+
+    assert acc.count == len(data)
+    assert acc.mean == pytest.approx(pps.mean(data))
+    for ddof in (0, 1):
+        assert acc.variance(ddof=ddof) == pytest.approx(pps.variance(data, ddof=ddof))
+        assert acc.std_dev(ddof=ddof) == pytest.approx(pps.std_dev(data, ddof=ddof))
+    assert acc.minimum == min(data)
+    assert acc.maximum == max(data)
+
+
+def test_running_moments_merge_equals_single_pass() -> None:
+    data = _data(999, seed=1)
+    parts = [RunningMoments().update_many(data[i : i + 137]) for i in range(0, 999, 137)]
+    merged = RunningMoments()
+    for part in parts:
+        merged.merge(part)
+
+    whole = RunningMoments()
+    for x in data:
+        whole.update(x)
+
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.variance() == pytest.approx(whole.variance())
+    assert merged.minimum == whole.minimum
+    assert merged.maximum == whole.maximum
+
+
+def test_running_covariance_matches_list_functions() -> None:
+    x = _data(400, seed=2)
+    y = [2.0 * xi + e for xi, e in zip(x, _data(400, seed=3))]
+
+    left = RunningCovariance().update_many(x[:150], y[:150])
+    right = RunningCovariance().update_many(x[150:], y[150:])
+    acc = left.merge(right)
+
+    assert acc.covariance(ddof=1) == pytest.approx(pps.covariance(x, y, ddof=1))
+    assert acc.covariance(ddof=0) == pytest.approx(pps.covariance(x, y, ddof=0))
+    assert acc.correlation() == pytest.approx(pps.correlation(x, y))
+
+
+def test_running_accumulators_validate_input() -> None:
+    with pytest.raises(ValueError):
+        RunningMoments().mean
+    with pytest.raises(ValueError):
+        RunningMoments().update(1.0).variance(ddof=1)
+    with pytest.raises(ValueError):
+        RunningCovariance().update_many([1.0, 2.0], [1.0])
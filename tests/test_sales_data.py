@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.sales_data import COLUMN_DTYPES, SalesCSVReader, read_sales_csv
+
+SAMPLE = Path(__file__).resolve().parents[1] / "data" / "sample_sales_data.csv"
+
+
+def test_reader_yields_typed_chunks() -> None:
+    reader = SalesCSVReader(SAMPLE, chunk_rows=4)
+    chunks = list(reader)
+
+    assert [len(c["date"]) for c in chunks] == [4, 4, 4, 3]
+    assert reader.rows_read == 15
+    for chunk in chunks:
+        assert {name: col.dtype for name, col in chunk.items()} == COLUMN_DTYPES
+    first = chunks[0]
+    assert first["date"][0] == np.datetime64("2024-01-01")
+    assert first["store_id"].tolist() == [1, 2, 3, 1]
+    assert first["total_revenue"][0] == 460.50
+    assert [reader.regions[c] for c in first["region"]] == ["North", "North", "South", "North"]
+
+
+def test_region_codes_are_stable_across_chunks() -> None:
+    columns, regions = read_sales_csv(SAMPLE, chunk_rows=2)
+    whole, _ = read_sales_csv(SAMPLE)
+
+    assert regions == ["North", "South", "West", "East"]
+    for name in columns:
+        np.testing.assert_array_equal(columns[name], whole[name])
+    assert columns["items_sold"].sum() == 363
+
+
+def test_reader_rejects_unexpected_header(tmp_path) -> None:
+    path = tmp_path / "bad.csv"
+    path.write_text("date,store,region\n2024-01-01,1,North\n")
+    with pytest.raises(ValueError):
+        list(SalesCSVReader(path))
+
+
+def test_empty_file_gives_empty_columns(tmp_path) -> None:
+    path = tmp_path / "empty.csv"
+    path.write_text("date,store_id,region,items_sold,total_revenue\n")
+    columns, regions = read_sales_csv(path)
+    assert regions == []
+    assert all(col.size == 0 and col.dtype == COLUMN_DTYPES[name] for name, col in columns.items())
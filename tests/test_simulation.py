@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from src.pure_python_stats import mean
+from src.simulation import SimulationResult, run_statistic_simulation
+
+
+def test_scalar_simulation_collects_one_value_per_replicate() -> None:
+    rng = random.Random(0)
+    result = run_statistic_simulation(
+        lambda n: [rng.gauss(0.0, 1.0) for _ in range(n)],
+        mean,
+        sample_size=10,
+        n_simulations=200,
+    )
+
+    assert result.statistic_name == "mean"
+    assert len(result.values) == 200
+    assert result.summary["count"] == 200.0
+
+
+def test_vectorized_simulation_matches_scalar_draws() -> None:
+    # Both modes consume the same stream when the generator is row-major.
+    data = np.random.default_rng(1).normal(size=(50, 8))
+    rows = iter(data)
+    scalar = run_statistic_simulation(lambda n: next(rows), np.mean, 8, 50)
+
+    pos = [0]
+
+    def block(size):
+        out = data[pos[0] : pos[0] + size[0]]
+        pos[0] += size[0]
+        return out
+
+    vec = run_statistic_simulation(block, np.mean, 8, 50, vectorized=True, chunk_size=7)
+
+    assert vec.n_simulations == 50
+    np.testing.assert_allclose(vec.values, scalar.values)
+    assert vec.summary["mean"] == pytest.approx(scalar.summary["mean"])
+
+
+def test_vectorized_simulation_validates_shapes() -> None:
+    with pytest.raises(ValueError):
+        run_statistic_simulation(
+            lambda size: np.zeros((size[0], size[1] + 1)), np.mean, 5, 10, vectorized=True
+        )
+    with pytest.raises(ValueError):
+        run_statistic_simulation(
+            lambda size: np.zeros(size), lambda b, axis: b, 5, 10, vectorized=True
+        )
+
+
+def _normal_factory(rng):
+    return lambda size: rng.normal(0.0, 1.0, size=size)
+
+
+def test_parallel_simulation_is_independent_of_worker_count() -> None:
+    from src.simulation import run_parallel_simulation
+
+    kwargs = dict(sample_size=12, n_simulations=1000, seed=42, chunk_size=128)
+    serial = run_parallel_simulation(_normal_factory, np.mean, max_workers=1, **kwargs)
+    pooled = run_parallel_simulation(_normal_factory, np.mean, max_workers=2, **kwargs)
+    vec = run_parallel_simulation(
+        _normal_factory, np.mean, max_workers=2, vectorized=True, **kwargs
+    )
+
+    np.testing.assert_array_equal(serial.values, pooled.values)
+    assert len(vec.values) == 1000
+    assert serial.metadata == {"seed": 42, "spawn_key": [], "chunk_size": 128}
+    assert abs(vec.summary["mean"]) < 0.05
+
+
+def test_parallel_metadata_reproduces_spawned_seed() -> None:
+    from src.simulation import run_parallel_simulation
+
+    child = np.random.SeedSequence(7).spawn(3)[2]
+    first = run_parallel_simulation(_normal_factory, np.mean, 5, 200, seed=child, max_workers=1)
+    recorded = np.random.SeedSequence(
+        first.metadata["seed"], spawn_key=first.metadata["spawn_key"]
+    )
+    again = run_parallel_simulation(_normal_factory, np.mean, 5, 200, seed=recorded, max_workers=1)
+
+    assert first.metadata["spawn_key"] == [2]
+    np.testing.assert_array_equal(first.values, again.values)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_streaming_simulation_summarizes_without_keeping_values(vectorized, tmp_path) -> None:
+    rng = np.random.default_rng(3)
+    gen = lambda size: rng.normal(0.0, 1.0, size=size)  # noqa: E731
+
+    streamed = run_statistic_simulation(
+        gen, np.mean, 20, 5000, vectorized=vectorized, streaming=True
+    )
+    assert streamed.values.size == 0
+    assert streamed.sketch is not None and streamed.sketch.count == 5000
+    assert streamed.summary["count"] == 5000.0
+    assert streamed.summary.keys() == run_statistic_simulation(gen, np.mean, 20, 10).summary.keys()
+
+    spill = tmp_path / "values.npy"
+    spilled = run_statistic_simulation(
+        gen, np.mean, 20, 5000, vectorized=vectorized, streaming=True, spill_path=spill
+    )
+    on_disk = np.load(spill)
+    assert on_disk.shape == (5000,)
+    assert spilled.summary["mean"] == pytest.approx(on_disk.mean())
+    assert spilled.summary["max"] == on_disk.max()
+    assert abs(spilled.summary["median"] - np.median(on_disk)) < 0.02
+
+
+def test_spill_path_requires_streaming(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        run_statistic_simulation(
+            lambda n: [0.0] * n, mean, 3, 5, spill_path=tmp_path / "x.npy"
+        )
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_multi_statistic_simulation_shares_samples(vectorized: bool) -> None:
+    from src.simulation import run_multi_statistic_simulation
+
+    calls = []
+    rng = np.random.default_rng(4)
+
+    def gen(size):
+        calls.append(size)
+        return rng.normal(size=size)
+
+    if vectorized:
+        stats = {"mean": np.mean, "total": np.sum}
+    else:
+        stats = {"mean": np.mean, "total": sum}
+
+    results = run_multi_statistic_simulation(
+        gen, stats, sample_size=5, n_simulations=40, vectorized=vectorized, chunk_size=16
+    )
+
+    assert list(results) == ["mean", "total"]
+    assert len(calls) == (3 if vectorized else 40)
+    np.testing.assert_allclose(np.multiply(results["mean"].values, 5), results["total"].values)
+    assert results["total"].statistic_name == "total"
+
+
+def test_adaptive_simulation_stops_at_target_precision() -> None:
+    rng = np.random.default_rng(5)
+    result = run_statistic_simulation(
+        lambda size: rng.normal(0.0, 1.0, size=size),
+        np.mean,
+        sample_size=25,
+        n_simulations=1_000_000,
+        vectorized=True,
+        chunk_size=500,
+        target_se=0.005,
+        precision_quantiles=(0.5,),
+    )
+
+    stopping = result.metadata["stopping"]
+    assert stopping["reason"] == "target_se"
+    assert result.n_simulations == len(result.values) == stopping["n_simulations"]
+    assert result.n_simulations < 1_000_000
+    assert max(stopping["standard_errors"].values()) <= 0.005
+    # Theoretical standard error of the mean of the sample means: 0.2 / sqrt(N).
+    assert stopping["standard_errors"]["mean"] == pytest.approx(
+        0.2 / np.sqrt(result.n_simulations), rel=0.1
+    )
+
+
+def test_adaptive_simulation_does_not_allocate_the_cap() -> None:
+    rng = np.random.default_rng(8)
+    result = run_statistic_simulation(
+        lambda size: rng.normal(0.0, 1.0, size=size),
+        np.mean,
+        sample_size=4,
+        n_simulations=10**13,  # 80 TB if preallocated
+        vectorized=True,
+        chunk_size=1000,
+        target_se=0.01,
+        precision_quantiles=(0.05, 0.95),
+    )
+
+    stopping = result.metadata["stopping"]
+    assert stopping["reason"] == "target_se"
+    assert max(stopping["standard_errors"].values()) <= 0.01
+    assert result.n_simulations < 200_000
+
+
+def test_adaptive_simulation_respects_time_budget_and_maximum() -> None:
+    rng = random.Random(6)
+    capped = run_statistic_simulation(
+        lambda n: [rng.random() for _ in range(n)], mean, 4, 300, chunk_size=100, target_se=1e-12
+    )
+    assert capped.metadata["stopping"]["reason"] == "n_simulations"
+    assert capped.n_simulations == 300
+
+    with pytest.raises(ValueError):
+        run_statistic_simulation(lambda n: [0.0] * n, mean, 3, 10, time_budget=1.0, streaming=True)
+
+
+def test_adaptive_simulation_stops_when_time_budget_is_spent() -> None:
+    rng = np.random.default_rng(7)
+    result = run_statistic_simulation(
+        lambda size: rng.normal(0.0, 1.0, size=size),
+        np.mean,
+        sample_size=10,
+        n_simulations=100_000,
+        vectorized=True,
+        chunk_size=100,
+        target_se=1e-12,
+        time_budget=1e-9,
+    )
+
+    stopping = result.metadata["stopping"]
+    assert stopping["reason"] == "time_budget"
+    assert stopping["time_budget"] == 1e-9
+    assert stopping["elapsed"] >= 1e-9
+    assert result.n_simulations == len(result.values) == stopping["n_simulations"] == 100
+
+
+def test_result_is_array_backed_with_lazy_summary() -> None:
+    result = run_statistic_simulation(_normal_factory(np.random.default_rng(3)), np.mean, 5, 100)
+
+    assert isinstance(result.values, np.ndarray) and result.values.dtype == np.float64
+    assert result._summary is None
+    assert result.summary["count"] == 100.0
+    assert not hasattr(result, "__dict__")
+
+
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+def test_result_npz_round_trip(tmp_path, mmap_mode) -> None:
+    result = run_statistic_simulation(
+        _normal_factory(np.random.default_rng(4)),
+        np.median,
+        7,
+        300,
+        metadata={"dist": "normal"},
+    )
+    path = tmp_path / "result.npz"
+    result.to_npz(path)
+    loaded = SimulationResult.from_npz(path, mmap_mode=mmap_mode)
+
+    np.testing.assert_array_equal(loaded.values, result.values)
+    assert isinstance(loaded.values, np.memmap) == (mmap_mode == "r")
+    assert (loaded.statistic_name, loaded.sample_size, loaded.n_simulations) == ("median", 7, 300)
+    assert loaded.metadata == {"dist": "normal"}
+    assert loaded.summary == pytest.approx(result.summary)
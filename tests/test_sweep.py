@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.sweep import run_sweep
+
+
+def _normal(rng):
+    return lambda size: rng.normal(0.0, 1.0, size=size)
+
+
+def _exponential(rng):
+    return lambda size: rng.exponential(1.0, size=size)
+
+
+def test_sweep_returns_tidy_table_independent_of_workers() -> None:
+    kwargs = dict(
+        generators={"normal": _normal, "exp": _exponential},
+        statistics={"mean": np.mean, "median": np.median},
+        sample_sizes=[50, 5, 20],
+        n_simulations=300,
+        seed=7,
+        chunk_size=128,
+    )
+    table = run_sweep(max_workers=1, **kwargs)
+    pooled = run_sweep(max_workers=2, **kwargs)
+
+    assert len(table["generator"]) == 2 * 2 * 3
+    assert list(table["sample_size"][:3]) == [5, 20, 50]
+    for key in table:
+        np.testing.assert_array_equal(table[key], pooled[key])
+
+    rows = (table["generator"] == "exp") & (table["statistic"] == "mean")
+    assert table["mean"][rows] == pytest.approx([1.0, 1.0, 1.0], abs=0.1)
+    assert np.all(np.diff(table["std"][rows]) < 0)
+    assert np.all(table["ci_lower"] <= table["ci_upper"])
+
+
+def test_nested_sweep_reuses_leading_columns() -> None:
+    table = run_sweep(
+        {"normal": _normal},
+        {"first": lambda block, axis: block[:, 0]},
+        sample_sizes=[1, 10],
+        n_simulations=50,
+        seed=1,
+        max_workers=1,
+    )
+    # The first observation is shared between sample sizes when nested.
+    assert table["mean"][0] == table["mean"][1]
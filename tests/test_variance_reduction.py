@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.pure_python_stats import mean
+from src.variance_reduction import run_antithetic_simulation, run_control_variate_simulation
+
+
+def test_antithetic_pairs_reduce_variance_of_monotone_statistic() -> None:
+    rng = np.random.default_rng(0)
+    result = run_antithetic_simulation(
+        lambda size: rng.uniform(-1.0, 1.0, size=size),
+        lambda block, axis: np.exp(block).mean(axis=axis),
+        sample_size=5,
+        n_pairs=2000,
+        vectorized=True,
+    )
+
+    report = result.metadata["variance_reduction"]
+    assert result.n_simulations == len(result.values) == 4000
+    assert report["method"] == "antithetic"
+    assert report["pair_correlation"] < 0
+    assert report["ess_gain"] > 2.0
+    assert report["estimate"] == pytest.approx(result.summary["mean"])
+    # E[exp(U)] for U ~ Uniform(-1, 1) is sinh(1).
+    assert report["estimate"] == pytest.approx(np.sinh(1.0), abs=4 * report["standard_error"])
+
+
+def test_control_variate_uses_known_mean_of_control() -> None:
+    rng = np.random.default_rng(1)
+
+    def gen(n):
+        return rng.exponential(2.0, size=n)
+
+    result = run_control_variate_simulation(
+        gen,
+        lambda sample: float(np.median(sample)),
+        control=mean,
+        control_mean=2.0,
+        sample_size=15,
+        n_simulations=3000,
+    )
+
+    report = result.metadata["variance_reduction"]
+    assert report["control_correlation"] > 0.5
+    assert report["ess_gain"] == pytest.approx(
+        1.0 / (1.0 - report["control_correlation"] ** 2), rel=0.05
+    )
+    assert report["standard_error"] < report["naive_standard_error"]
+
+
+def test_sweep_common_random_numbers_share_streams() -> None:
+    from src.sweep import run_sweep
+
+    table = run_sweep(
+        {"a": _shifted_normal_0, "b": _shifted_normal_1},
+        {"mean": np.mean},
+        sample_sizes=[10],
+        n_simulations=200,
+        seed=3,
+        max_workers=1,
+        common_random_numbers=True,
+    )
+    assert table["mean"][1] - table["mean"][0] == pytest.approx(1.0)
+    assert table["std"][0] == pytest.approx(table["std"][1])
+
+
+def _shifted_normal_0(rng):
+    return lambda size: rng.normal(0.0, 1.0, size=size)
+
+
+def _shifted_normal_1(rng):
+    return lambda size: rng.normal(1.0, 1.0, size=size)